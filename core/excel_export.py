@@ -0,0 +1,178 @@
+"""
+Excel Export Module
+Writes medication logs to Excel workbooks
+"""
+
+# Characters Excel doesn't allow in worksheet titles
+_SHEET_TITLE_TRANS = str.maketrans({c: '-' for c in '[]:*?/\\'})
+
+
+def export_log_to_excel(log_data, filename):
+    """Export one log to an Excel file"""
+    export_logs_to_excel([("Medication Log", log_data)], filename)
+
+
+def export_logs_to_excel(sheets, filename, on_sheet=None):
+    """
+    Export logs to one Excel file, one worksheet per (sheet title, log data) pair
+
+    on_sheet, if given, is called with (sheets written, sheet title) after
+    each worksheet is filled.
+    """
+    try:
+        # Excel libraries are imported here rather than at startup.
+        # xlsxwriter is used when installed (faster, constant memory),
+        # otherwise openpyxl; an error is reported if neither is available
+        try:
+            import xlsxwriter
+        except ImportError:
+            pass
+        else:
+            # constant_memory flushes each row to disk once the next one starts
+            with xlsxwriter.Workbook(filename, {'constant_memory': True}) as wb:
+                # Formats are created once per workbook
+                formats = (wb.add_format({'bold': True, 'font_size': 16}),
+                           wb.add_format({'bold': True, 'font_size': 14}),
+                           wb.add_format({'bold': True, 'bg_color': '#CCCCCC', 'pattern': 1}))
+                for count, (title, log_data) in enumerate(sheets, 1):
+                    _write_xlsxwriter_sheet(wb.add_worksheet(title), formats, *_excel_log_rows(log_data))
+                    if on_sheet is not None:
+                        on_sheet(count, title)
+            return
+
+        import openpyxl
+        from openpyxl.styles import Font, PatternFill
+
+        # Rows are streamed through a write-only workbook instead of
+        # keeping every cell in memory
+        wb = openpyxl.Workbook(write_only=True)
+        styles = (Font(size=16, bold=True),
+                  Font(size=14, bold=True),
+                  Font(bold=True),
+                  PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"))
+        for count, (title, log_data) in enumerate(sheets, 1):
+            _write_openpyxl_sheet(wb.create_sheet(title), styles, *_excel_log_rows(log_data))
+            if on_sheet is not None:
+                on_sheet(count, title)
+
+        # Save workbook
+        wb.save(filename)
+
+    except ImportError:
+        raise ImportError("openpyxl library not installed. Install it with: pip install openpyxl")
+    except Exception as e:
+        raise Exception(f"Failed to export to Excel: {e}")
+
+
+def _excel_log_rows(log_data):
+    """Rows for a log's worksheet: (info rows, headers, entry rows, column widths)"""
+    info_rows = [
+        (label, log_data.get(field_name, ''))
+        for label, field_name in (("Medicine Name:", 'medicine_name'),
+                                  ("Strength:", 'strength'),
+                                  ("Dosage:", 'dosage'),
+                                  ("Month/Year:", 'month_year'),
+                                  ("Reason Prescribed:", 'reason_prescribed'),
+                                  ("Reason PRN:", 'reason_prn'))
+    ]
+    headers = ('Day', 'Time', 'Initials', 'Amount Remaining')
+    entry_rows = [
+        (entry.get('day', ''), entry.get('time', ''),
+         entry.get('initials', ''), entry.get('amount_remaining', ''))
+        for entry in log_data.get('administration_log', [])
+    ]
+
+    # Column widths (columns A-D) from everything that will be written
+    col_widths = [len("Medication Log Data"), 0, 0, 0]
+    for label, value in info_rows:
+        col_widths[0] = max(col_widths[0], len(label))
+        col_widths[1] = max(col_widths[1], len(str(value)))
+    for row in (headers, *entry_rows):
+        for col, value in enumerate(row):
+            length = len(str(value))
+            if length > col_widths[col]:
+                col_widths[col] = length
+
+    return info_rows, headers, entry_rows, col_widths
+
+
+def _write_openpyxl_sheet(ws, styles, info_rows, headers, entry_rows, col_widths):
+    """Fill a write-only openpyxl worksheet with a log"""
+    from openpyxl.cell import WriteOnlyCell
+
+    title_font, section_font, header_font, header_fill = styles
+
+    # Widths go first: write-only sheets emit them before any rows
+    for column_letter, max_length in zip('ABCD', col_widths):
+        ws.column_dimensions[column_letter].width = min(max_length + 2, 50)
+
+    def styled(value, font, fill=None):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        return cell
+
+    # Add header
+    ws.append((styled("Medication Log Data", title_font),))
+    ws.append(())
+
+    # Add basic info
+    for row in info_rows:
+        ws.append(row)
+    ws.append(())
+
+    # Add administration log table
+    ws.append((styled("Administration Log", section_font),))
+
+    # Table headers
+    ws.append(tuple(styled(header, header_font, header_fill) for header in headers))
+
+    # Add administration entries, one row per call
+    append = ws.append
+    for row in entry_rows:
+        append(row)
+
+
+def _write_xlsxwriter_sheet(ws, formats, info_rows, headers, entry_rows, col_widths):
+    """Fill an xlsxwriter worksheet with a log (same layout as the openpyxl path)"""
+    title_format, section_format, header_format = formats
+
+    for col, max_length in enumerate(col_widths):
+        ws.set_column(col, col, min(max_length + 2, 50))
+
+    # Add header
+    ws.write(0, 0, "Medication Log Data", title_format)
+
+    # Add basic info
+    row = 2
+    for info_row in info_rows:
+        ws.write_row(row, 0, info_row)
+        row += 1
+
+    # Add administration log table
+    ws.write(row + 1, 0, "Administration Log", section_format)
+    ws.write_row(row + 2, 0, headers, header_format)
+
+    # Add administration entries
+    write_row = ws.write_row
+    for row, entry_row in enumerate(entry_rows, row + 3):
+        write_row(row, 0, entry_row)
+
+
+def excel_sheet_titles(labels):
+    """Valid, unique Excel worksheet titles (max 31 characters) for the given labels"""
+    titles = []
+    used = set()
+    for label in labels:
+        base = label.translate(_SHEET_TITLE_TRANS)[:31].strip("' ") or "Log"
+        title = base
+        suffix = 2
+        # Excel compares sheet names case-insensitively
+        while title.lower() in used:
+            tag = f" ({suffix})"
+            title = base[:31 - len(tag)] + tag
+            suffix += 1
+        used.add(title.lower())
+        titles.append(title)
+    return titles
@@ -4,27 +4,38 @@ Handles generation of Word documents and PDF conversion
 """
 
 import os
-from docx import Document
-from docx.shared import Pt
 from collections import defaultdict
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from .resource_manager import ResourceManager
 
+# python-docx is imported where it is used so loading this module (and the
+# GUI) doesn't pay for it until the first export
+if TYPE_CHECKING:
+    from docx.document import Document
+
+# docx.shared.Pt, imported on the first call to _set_cell_font_size (which
+# runs once per table cell) rather than on every call
+_Pt = None
+
+# Characters replaced when building export filenames (add new rules here)
+_FILENAME_TRANS = str.maketrans({' ': '_', '/': '-', '\\': '-', ':': '-'})
+
 
 class ExportManager:
     """Manages export of logs to Word and PDF formats"""
 
-    def __init__(self, template_path: str = None):
+    def __init__(self, template_path: str = None, resource_manager: ResourceManager = None):
         """
         Initialize ExportManager
 
         Args:
             template_path: Optional path to template (for backward compatibility)
                           If None, uses ResourceManager to find template
+            resource_manager: Optional shared ResourceManager instance
         """
         if template_path is None:
             # Use ResourceManager to find bundled template
-            resource_manager = ResourceManager()
+            resource_manager = resource_manager or ResourceManager()
             self.template_path = str(resource_manager.get_template_path())
         else:
             # Legacy mode for development/testing
@@ -41,6 +52,7 @@ class ExportManager:
 
         # Validate template can be opened and has required tables
         try:
+            from docx import Document
             doc = Document(self.template_path)
 
             # Check that template has at least 3 tables (for standard medication log)
@@ -74,6 +86,7 @@ class ExportManager:
         self._validate_template()
 
         # Load template
+        from docx import Document
         doc = Document(self.template_path)
 
         # Fill basic information
@@ -96,11 +109,15 @@ class ExportManager:
     
     def _set_cell_font_size(self, cell, size=8):
         """Set font size for all text in a cell"""
+        global _Pt
+        if _Pt is None:
+            from docx.shared import Pt as _Pt
+        font_size = _Pt(size)
         for paragraph in cell.paragraphs:
             for run in paragraph.runs:
-                run.font.size = Pt(size)
+                run.font.size = font_size
 
-    def _fill_basic_info(self, doc: Document, profile_data: Dict, log_data: Dict):
+    def _fill_basic_info(self, doc: 'Document', profile_data: Dict, log_data: Dict):
         """Fill basic patient and medication information"""
 
         replacements = {
@@ -127,7 +144,7 @@ class ExportManager:
                         if placeholder in cell.text:
                             cell.text = cell.text.replace(placeholder, value)
     
-    def _fill_administration_log_extended(self, doc: Document, admin_log: list):
+    def _fill_administration_log_extended(self, doc: 'Document', admin_log: list):
         """Fill the daily administration log table with extended rows for more than 3 administrations"""
 
         admin_table = doc.tables[2]
@@ -195,8 +212,9 @@ class ExportManager:
             amount_row = table.add_row()
             amount_row.cells[0].text = "Amount Remaining:"
 
-    def _fill_administration_log_continuation(self, doc: Document, profile_data: Dict, log_data: Dict):
+    def _fill_administration_log_continuation(self, doc: 'Document', profile_data: Dict, log_data: Dict):
         """Fill administration log using continuation pages when more than 3 administrations per day"""
+        from docx import Document
 
         admin_log = log_data['administration_log']
         admin_table = doc.tables[2]
@@ -317,7 +335,7 @@ class ExportManager:
                     if placeholder in cell.text:
                         cell.text = cell.text.replace(placeholder, value)
 
-    def _add_medication_images(self, doc: Document, image_paths: list):
+    def _add_medication_images(self, doc: 'Document', image_paths: list):
         """Add medication card images to the document"""
         if not image_paths:
             return
@@ -329,7 +347,7 @@ class ExportManager:
         heading = doc.add_heading('Medication Images', level=1)
 
         # Add each image
-        from docx.shared import Inches
+        from docx.shared import Inches, Pt
 
         for i, image_path in enumerate(image_paths):
             if not os.path.exists(image_path):
@@ -369,11 +387,25 @@ class ExportManager:
             Path to PDF if successful, None if conversion failed
         """
         if pdf_path is None:
-            pdf_path = word_path.replace('.docx', '.pdf')
+            pdf_path = os.path.splitext(word_path)[0] + '.pdf'
         
         try:
             from docx2pdf import convert
-            convert(word_path, pdf_path)
+
+            # docx2pdf drives Word over COM on Windows, which has to be
+            # initialised on the calling thread (exports run off the Tk thread)
+            try:
+                import pythoncom
+            except ImportError:
+                pythoncom = None
+
+            if pythoncom is not None:
+                pythoncom.CoInitialize()
+            try:
+                convert(word_path, pdf_path)
+            finally:
+                if pythoncom is not None:
+                    pythoncom.CoUninitialize()
             return pdf_path
         except ImportError:
             print("Warning: docx2pdf not available. PDF conversion skipped.")
@@ -382,6 +414,13 @@ class ExportManager:
             print(f"Warning: PDF conversion failed: {e}")
             return None
     
+    @staticmethod
+    def get_filename_base(log_data: Dict) -> str:
+        """Get export filename (without extension) for a log, e.g. Tylenol_January_2025"""
+        medicine_name = log_data.get('medicine_name', 'unknown').translate(_FILENAME_TRANS)
+        month_year = log_data['month_year'].translate(_FILENAME_TRANS)
+        return f"{medicine_name}_{month_year}"
+
     def get_patient_export_dir(self, profile_id: str, data_dir: str = "data/patients") -> str:
         """Get patient-specific export directory"""
         export_dir = os.path.join(data_dir, profile_id, "exports")
@@ -417,9 +456,7 @@ class ExportManager:
 
         # Generate filename if not provided
         if filename_base is None:
-            medicine_name = log_data.get('medicine_name', 'unknown').replace(' ', '_')
-            month_year = log_data['month_year'].replace(' ', '_')
-            filename_base = f"{medicine_name}_{month_year}"
+            filename_base = self.get_filename_base(log_data)
 
         # Get medication card images if requested
         med_card_images = []
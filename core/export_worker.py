@@ -0,0 +1,67 @@
+"""
+Export Worker Module
+Entry point for batch export worker processes. Workers are spawned and
+import only this module and the core modules it needs (main.py imports the
+GUI inside main(), so re-running it as __mp_main__ doesn't load tkinter).
+"""
+
+import os
+from .export import ExportManager
+from .excel_export import export_log_to_excel
+
+# One ExportManager per template, reused for every log a worker exports
+_export_managers = {}
+
+
+def _get_export_manager(template_path):
+    """Shared ExportManager for a template in this process"""
+    export_manager = _export_managers.get(template_path)
+    if export_manager is None:
+        export_manager = _export_managers[template_path] = ExportManager(template_path)
+    return export_manager
+
+
+def run_single_export(template_path, profile, log_data, output_dir, export_docx,
+                      export_excel, export_method, include_images, data_dir):
+    """
+    Export one log to Word and/or Excel (runs in a batch export worker)
+
+    Returns:
+        Tuple of (dict of format -> path, error message). The dict is None if
+        the log could not be exported at all.
+    """
+    try:
+        result = {}
+
+        if export_docx:
+            export_manager = _get_export_manager(template_path)
+            result.update(export_manager.export_log(
+                profile,
+                log_data,
+                output_dir=output_dir,
+                create_pdf=False,
+                export_method=export_method,
+                include_images=include_images,
+                data_dir=data_dir
+            ))
+
+        if export_excel:
+            # Determine Excel filename
+            if 'docx' in result:
+                excel_path = os.path.splitext(result['docx'])[0] + '.xlsx'
+            else:
+                filename_base = ExportManager.get_filename_base(log_data)
+                excel_path = os.path.join(output_dir, f"{filename_base}.xlsx")
+
+            try:
+                export_log_to_excel(log_data, excel_path)
+                result['xlsx'] = excel_path
+            except Exception as excel_error:
+                if export_docx:
+                    return result, f"Excel export failed ({excel_error})"
+                raise
+
+        return result, None
+
+    except Exception as e:
+        return None, str(e)
@@ -3,12 +3,24 @@ Logging Configuration Module
 Sets up application logging to user data directory
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 from .resource_manager import ResourceManager
 
+# Background thread that writes queued log records to the handlers
+_queue_listener = None
+
+# Old log files are cleaned at most once per this many seconds; the time of
+# the last clean is the mtime of this file in the log directory
+CLEAN_INTERVAL_SECONDS = 24 * 60 * 60
+CLEAN_SENTINEL = ".last_clean"
+
 
 def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     """
@@ -39,19 +51,29 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     root_logger.setLevel(log_level)
 
     # Remove any existing handlers
+    stop_logging()
     root_logger.handlers.clear()
 
     # File handler - logs everything
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
 
     # Console handler - only warnings and errors
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.WARNING)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+
+    # Loggers only put records on a queue; the listener thread does the
+    # writing so logging never blocks the caller on disk I/O
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    global _queue_listener
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
 
     # Log startup message
     logger = logging.getLogger(__name__)
@@ -66,6 +88,20 @@ def setup_logging(log_level: int = logging.INFO) -> logging.Logger:
     return root_logger
 
 
+def stop_logging():
+    """Write out any queued log records and stop the logging thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+# Registered once; stop_logging does nothing if no listener is running
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module
@@ -108,6 +144,14 @@ def clean_old_logs(days_to_keep: int = 30):
         if not log_dir.exists():
             return
 
+        # Skip the directory scan if it already ran recently
+        sentinel = log_dir / CLEAN_SENTINEL
+        try:
+            if time.time() - sentinel.stat().st_mtime < CLEAN_INTERVAL_SECONDS:
+                return
+        except OSError:
+            pass  # Never cleaned before
+
         from datetime import timedelta
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
 
@@ -123,5 +167,7 @@ def clean_old_logs(days_to_keep: int = 30):
             except Exception as e:
                 logging.warning(f"Could not delete log file {log_file.name}: {e}")
 
+        sentinel.touch()
+
     except Exception as e:
         logging.error(f"Error cleaning old logs: {e}")
@@ -3,35 +3,46 @@ Log Management Module
 Handles CRUD operations for medication administration logs
 """
 
+import copy
 import json
 import os
 import tempfile
 from datetime import datetime
 from typing import Dict, Optional, List
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from .resource_manager import ResourceManager
 
 
 class LogManager:
     """Manages medication administration logs with persistent JSON storage"""
 
-    def __init__(self, data_dir: str = None):
+    # Number of parsed log files kept in memory
+    LOG_CACHE_SIZE = 256
+
+    def __init__(self, data_dir: str = None, resource_manager: ResourceManager = None):
         """
         Initialize LogManager
 
         Args:
             data_dir: Optional legacy data directory (for backward compatibility)
                      If None, uses ResourceManager to determine path
+            resource_manager: Optional shared ResourceManager instance
         """
         if data_dir is None:
             # Use ResourceManager for new path structure
-            self.resource_manager = ResourceManager()
+            self.resource_manager = resource_manager or ResourceManager()
             self.data_dir = str(self.resource_manager.user_data_dir / "patients")
         else:
             # Legacy mode for development/testing
             self.resource_manager = None
             self.data_dir = data_dir
 
+        # filename -> ((mtime_ns, size), parsed log), least recently used first
+        self._log_cache = OrderedDict()
+
+        # profile_id -> (logs dir mtime_ns, sorted (medicine_name, month_year) tuples)
+        self._log_list_cache = {}
+
         self._ensure_data_dir()
 
     def _ensure_data_dir(self):
@@ -52,15 +63,43 @@ class LogManager:
         logs_dir = self._get_patient_logs_dir(profile_id)
         return os.path.join(logs_dir, f"{safe_medicine}_{safe_month}.json")
     
+    def _read_log(self, filename: str) -> Optional[Dict]:
+        """
+        Load log from file, reusing the cached copy while the file is unchanged.
+        The returned dict is shared with the cache and must not be modified.
+        """
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            self._log_cache.pop(filename, None)
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._log_cache.get(filename)
+        if cached is not None and cached[0] == key:
+            self._log_cache.move_to_end(filename)
+            return cached[1]
+
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                log_data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"Failed to load log from {filename}: {str(e)}")
+
+        self._cache_log(filename, key, log_data)
+        return log_data
+
+    def _cache_log(self, filename: str, key: tuple, log_data: Dict):
+        """Store a parsed log, evicting the least recently used one if full"""
+        self._log_cache[filename] = (key, log_data)
+        self._log_cache.move_to_end(filename)
+        if len(self._log_cache) > self.LOG_CACHE_SIZE:
+            self._log_cache.popitem(last=False)
+
     def _load_log(self, filename: str) -> Optional[Dict]:
-        """Load log from file"""
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (IOError, json.JSONDecodeError) as e:
-                raise RuntimeError(f"Failed to load log from {filename}: {str(e)}")
-        return None
+        """Load log from file (callers get their own copy to modify)"""
+        log_data = self._read_log(filename)
+        return copy.deepcopy(log_data) if log_data is not None else None
     
     def _save_log(self, filename: str, log_data: Dict):
         """Save log to file using atomic write"""
@@ -89,6 +128,15 @@ class LogManager:
                 except OSError:
                     pass  # Best effort cleanup
             raise RuntimeError(f"Failed to save log to {filename}: {str(e)}")
+
+        # Cache what was written so the next read skips the disk; the save
+        # itself succeeded, so a failed stat only drops the cached copy
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            self._log_cache.pop(filename, None)
+        else:
+            self._cache_log(filename, (stat.st_mtime_ns, stat.st_size), copy.deepcopy(log_data))
     
     def get_log(self, profile_id: str, medicine_name: str, month_year: str) -> Optional[Dict]:
         """Get log for specific patient/medicine/month"""
@@ -117,6 +165,7 @@ class LogManager:
 
         filename = self._get_log_filename(profile_id, medicine_name, month_year)
         self._save_log(filename, log_data)
+        self._log_list_cache.pop(profile_id, None)
 
         return log_data
     
@@ -125,6 +174,7 @@ class LogManager:
         log_data['updated_at'] = datetime.now().isoformat()
         filename = self._get_log_filename(profile_id, medicine_name, month_year)
         self._save_log(filename, log_data)
+        self._log_list_cache.pop(profile_id, None)
     
     def log_exists(self, profile_id: str, medicine_name: str, month_year: str) -> bool:
         """Check if log exists for patient/medicine/month"""
@@ -139,21 +189,33 @@ class LogManager:
         if not os.path.exists(logs_dir):
             return logs
 
-        for filename in os.listdir(logs_dir):
-            if filename.endswith('.json'):
-                # Load the file to get the actual medicine_name and month_year
-                log_data = self._load_log(os.path.join(logs_dir, filename))
-                if log_data:
-                    medicine_name = log_data.get('medicine_name', '')
-                    month_year = log_data.get('month_year', '')
-                    logs.append((medicine_name, month_year))
-
-        return sorted(logs, key=lambda x: (x[1], x[0]))  # Sort by month_year, then medicine_name
+        # Reuse the last listing while the directory's mtime and its log
+        # files are unchanged (the names catch changes a coarse mtime misses;
+        # this manager's own writes drop the listing outright)
+        dir_mtime = os.stat(logs_dir).st_mtime_ns
+        filenames = tuple(sorted(f for f in os.listdir(logs_dir) if f.endswith('.json')))
+        cache_key = (dir_mtime, filenames)
+        cached = self._log_list_cache.get(profile_id)
+        if cached is not None and cached[0] == cache_key:
+            return list(cached[1])
+
+        for filename in filenames:
+            # Load the file to get the actual medicine_name and month_year
+            log_data = self._read_log(os.path.join(logs_dir, filename))
+            if log_data:
+                medicine_name = log_data.get('medicine_name', '')
+                month_year = log_data.get('month_year', '')
+                logs.append((medicine_name, month_year))
+
+        logs.sort(key=lambda x: (x[1], x[0]))  # Sort by month_year, then medicine_name
+        self._log_list_cache[profile_id] = (cache_key, tuple(logs))
+        return logs
     
-    def add_entry(self, profile_id: str, medicine_name: str, month_year: str, entry_data: Dict):
+    def add_entry(self, profile_id: str, medicine_name: str, month_year: str, entry_data: Dict) -> Dict:
         """
         Add administration entry to log
         entry_data should contain: day, time, initials, amount_remaining
+        Returns the updated log data
         """
         log_data = self.get_log(profile_id, medicine_name, month_year)
 
@@ -169,6 +231,7 @@ class LogManager:
 
         # Save
         self.save_log(profile_id, medicine_name, month_year, log_data)
+        return log_data
     
     def get_entries_for_day(self, profile_id: str, medicine_name: str, month_year: str, day: int) -> List[Dict]:
         """Get all entries for a specific day"""
@@ -206,10 +269,11 @@ class LogManager:
         # Save
         self.save_log(profile_id, medicine_name, month_year, log_data)
     
-    def delete_entry(self, profile_id: str, medicine_name: str, month_year: str, day: int, admin_index: int):
+    def delete_entry(self, profile_id: str, medicine_name: str, month_year: str, day: int, admin_index: int) -> Dict:
         """
         Delete specific entry
         admin_index is 0-2 for the 1st, 2nd, or 3rd administration that day
+        Returns the updated log data
         """
         log_data = self.get_log(profile_id, medicine_name, month_year)
 
@@ -231,9 +295,10 @@ class LogManager:
 
         # Save
         self.save_log(profile_id, medicine_name, month_year, log_data)
+        return log_data
     
-    def delete_all_entries_for_day(self, profile_id: str, medicine_name: str, month_year: str, day: int):
-        """Delete all entries for a specific day"""
+    def delete_all_entries_for_day(self, profile_id: str, medicine_name: str, month_year: str, day: int) -> Dict:
+        """Delete all entries for a specific day, returning the updated log data"""
         log_data = self.get_log(profile_id, medicine_name, month_year)
 
         if log_data is None:
@@ -247,6 +312,7 @@ class LogManager:
 
         # Save
         self.save_log(profile_id, medicine_name, month_year, log_data)
+        return log_data
     
     def get_administration_summary(self, profile_id: str, medicine_name: str, month_year: str) -> Dict:
         """Get summary of which days have entries"""
@@ -266,6 +332,9 @@ class LogManager:
         """Delete entire log file"""
         filename = self._get_log_filename(profile_id, medicine_name, month_year)
 
+        self._log_cache.pop(filename, None)
+        self._log_list_cache.pop(profile_id, None)
+
         if os.path.exists(filename):
             os.remove(filename)
             return True
@@ -25,23 +25,27 @@ except ImportError:
 class MedicationCardManager:
     """Manages medication card templates with image support"""
 
-    def __init__(self, data_dir: str = None):
+    def __init__(self, data_dir: str = None, resource_manager: ResourceManager = None):
         """
         Initialize MedicationCardManager
 
         Args:
             data_dir: Optional legacy data directory (for backward compatibility)
                      If None, uses ResourceManager to determine path
+            resource_manager: Optional shared ResourceManager instance
         """
         if data_dir is None:
             # Use ResourceManager for new path structure
-            self.resource_manager = ResourceManager()
+            self.resource_manager = resource_manager or ResourceManager()
             self.data_dir = str(self.resource_manager.user_data_dir / "patients")
         else:
             # Legacy mode for development/testing
             self.resource_manager = None
             self.data_dir = data_dir
 
+        # Per-profile counter bumped whenever cards are added or removed
+        self._list_versions = {}
+
         self._ensure_data_dir()
 
     def _ensure_data_dir(self):
@@ -113,6 +117,17 @@ class MedicationCardManager:
                     pass  # Best effort cleanup
             raise RuntimeError(f"Failed to save medication cards to {cards_file}: {str(e)}")
 
+    def _bump_version(self, profile_id: str):
+        """Record that the set of card names for a patient changed"""
+        self._list_versions[profile_id] = self._list_versions.get(profile_id, 0) + 1
+
+    def get_version(self, profile_id: str) -> int:
+        """
+        Get the card list version for a patient
+        Changes whenever a card is created or deleted through this manager
+        """
+        return self._list_versions.get(profile_id, 0)
+
     def get_all_cards(self, profile_id: str) -> Dict:
         """Get all medication cards for a patient"""
         return self._load_cards(profile_id)
@@ -150,6 +165,7 @@ class MedicationCardManager:
 
         cards[medicine_name] = card
         self._save_cards(profile_id, cards)
+        self._bump_version(profile_id)
 
         return card
 
@@ -187,6 +203,7 @@ class MedicationCardManager:
         # Remove card
         del cards[medicine_name]
         self._save_cards(profile_id, cards)
+        self._bump_version(profile_id)
 
     def add_image(self, profile_id: str, medicine_name: str, image_path: str) -> str:
         """
@@ -15,17 +15,18 @@ from .resource_manager import ResourceManager
 class ProfileManager:
     """Manages patient profiles with persistent JSON storage"""
 
-    def __init__(self, data_dir: str = None):
+    def __init__(self, data_dir: str = None, resource_manager: ResourceManager = None):
         """
         Initialize ProfileManager
 
         Args:
             data_dir: Optional legacy data directory (for backward compatibility)
                      If None, uses ResourceManager to determine path
+            resource_manager: Optional shared ResourceManager instance
         """
         if data_dir is None:
             # Use ResourceManager for new path structure
-            self.resource_manager = ResourceManager()
+            self.resource_manager = resource_manager or ResourceManager()
             self.profiles_file = str(self.resource_manager.get_profiles_path())
             self.data_dir = str(self.resource_manager.user_data_dir)
         else:
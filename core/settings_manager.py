@@ -13,9 +13,14 @@ from .resource_manager import ResourceManager
 class SettingsManager:
     """Manages application settings and user preferences"""
 
-    def __init__(self):
-        """Initialize the settings manager"""
-        self.resource_manager = ResourceManager()
+    def __init__(self, resource_manager: ResourceManager = None):
+        """
+        Initialize the settings manager
+
+        Args:
+            resource_manager: Optional shared ResourceManager instance
+        """
+        self.resource_manager = resource_manager or ResourceManager()
         self.settings_file = self.resource_manager.user_data_dir.parent / "settings.json"
         self.settings = self._load_settings()
 
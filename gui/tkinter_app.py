@@ -6,27 +6,100 @@ Main application window with tabbed interface
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import json
+import copy
+import threading
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import difflib
+from bisect import bisect_left
+import calendar
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 import os
 import sys
+import shutil
 import subprocess
-import platform
 from PIL import Image, ImageTk
 
+
+# orjson is optional - speeds up the JSON editor for large logs
+try:
+    import orjson
+
+    def _json_dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps_pretty(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+    _json_loads = json.loads
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.resource_manager import ResourceManager
 from core.profiles import ProfileManager
 from core.logs import LogManager
 from core.export import ExportManager
+from core.excel_export import export_log_to_excel, export_logs_to_excel, excel_sheet_titles
+from core.export_worker import run_single_export
 from core.medication_cards import MedicationCardManager
 from core.settings_manager import SettingsManager
 
 
+# Opens a file or folder with the system default application; resolved once
+# per platform
+if sys.platform == 'win32':
+    _open_path = os.startfile
+elif sys.platform == 'darwin':
+    def _open_path(path):
+        subprocess.Popen(['open', path], start_new_session=True)
+else:
+    def _open_path(path):
+        subprocess.Popen(['xdg-open', path], stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+
+
 class MedicationTrackerApp:
     """Main application window"""
-    
+
+    # Calendar view layout (pixels)
+    CALENDAR_HEADER_HEIGHT = 24
+    CALENDAR_CELL_HEIGHT = 80
+    CALENDAR_MIN_CELL_WIDTH = 80
+    CALENDAR_CELL_PROC = '::medlog_calendar_cell'
+
+    # Calendar cell backgrounds
+    CALENDAR_EMPTY_BG = '#f0f0f0'    # Day from prev/next month
+    CALENDAR_ACTIVE_BG = '#e8f4f8'   # Day with entries
+    CALENDAR_DEFAULT_BG = 'white'
+
+    # Administration entries inserted per idle callback
+    ENTRIES_CHUNK_SIZE = 50
+
+    # Batch exports of more logs than this list their results in a
+    # scrollable window instead of a message box
+    EXPORT_SUMMARY_MAX_LOGS = 50
+
+    # Batch exports of at least this many logs run in worker processes (at
+    # most EXPORT_MAX_WORKERS); smaller ones run on the export thread
+    EXPORT_PROCESS_POOL_MIN_LOGS = 8
+    EXPORT_MAX_WORKERS = 4
+
+    # Rough size of one exported log (Word document), used to check free space
+    EXPORT_BYTES_PER_LOG = 500_000
+
+    # Characters inserted per call when loading the JSON editor
+    JSON_INSERT_CHUNK = 65536
+
+    # Month choices for the new-log and export dialogs
+    MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+              'July', 'August', 'September', 'October', 'November', 'December')
+
     def __init__(self, root):
         self.root = root
         self.root.title("Medication Log Tracker")
@@ -34,10 +107,21 @@ class MedicationTrackerApp:
         self.root.minsize(900, 600)  # Set minimum window size
 
         # Initialize managers with error handling
-        # Use ResourceManager (no data_dir parameter = uses ~/MedicationLogger/)
+        # All managers share one ResourceManager (uses ~/MedicationLogger/)
+        try:
+            self.resource_manager = ResourceManager()
+        except Exception as e:
+            messagebox.showerror(
+                "Initialization Error",
+                f"Failed to initialize Resource Manager:\n{str(e)}\n\n"
+                "The application may not function correctly."
+            )
+            self.resource_manager = None
+
         try:
-            self.profile_manager = ProfileManager()  # Uses ResourceManager
-            self.data_dir = str(self.profile_manager.resource_manager.user_data_dir)
+            self.profile_manager = ProfileManager(resource_manager=self.resource_manager)
+            self.data_dir = self.profile_manager.data_dir  # Cached for tab construction
+            self.patients_dir = os.path.join(self.data_dir, "patients")  # Per-patient data, used by exports
         except Exception as e:
             messagebox.showerror(
                 "Initialization Error",
@@ -47,9 +131,10 @@ class MedicationTrackerApp:
             # Use a fallback empty manager
             self.profile_manager = None
             self.data_dir = None
+            self.patients_dir = None
 
         try:
-            self.log_manager = LogManager()  # Uses ResourceManager
+            self.log_manager = LogManager(resource_manager=self.resource_manager)
         except Exception as e:
             messagebox.showerror(
                 "Initialization Error",
@@ -59,7 +144,7 @@ class MedicationTrackerApp:
             self.log_manager = None
 
         try:
-            self.medication_card_manager = MedicationCardManager()  # Uses ResourceManager
+            self.medication_card_manager = MedicationCardManager(resource_manager=self.resource_manager)
         except Exception as e:
             messagebox.showerror(
                 "Initialization Error",
@@ -69,7 +154,7 @@ class MedicationTrackerApp:
             self.medication_card_manager = None
 
         try:
-            self.export_manager = ExportManager()  # Uses ResourceManager
+            self.export_manager = ExportManager(resource_manager=self.resource_manager)
         except Exception as e:
             messagebox.showerror(
                 "Initialization Error",
@@ -80,7 +165,7 @@ class MedicationTrackerApp:
             self.export_manager = None
 
         try:
-            self.settings_manager = SettingsManager()
+            self.settings_manager = SettingsManager(resource_manager=self.resource_manager)
         except Exception as e:
             messagebox.showerror(
                 "Initialization Error",
@@ -101,6 +186,44 @@ class MedicationTrackerApp:
         self.current_medicine_name = None
         self.current_month_year = None
         self.current_log = None
+        self.current_med_card_profile_id = None
+        self.current_med_card = None
+        self.available_logs = []  # (medicine_name, month_year) tuples in log_combo
+        self._available_logs_index = {}  # (medicine_name, month_year) -> log_combo index
+
+        # Profile list and lookups, rebuilt by _refresh_profile_caches
+        self._profile_list = ()
+        self._profiles_by_name = {}
+        self._profiles_by_id = {}
+
+        # Pending after_idle id while entries_tree is being filled
+        self._entries_fill_after_id = None
+
+        # Bumped whenever current_log's entries change; entries_tree is only
+        # rebuilt when the rendered version is behind
+        self._entries_version = 0
+        self._entries_rendered_version = -1
+
+        # Position of each administration_log entry within its day, and the
+        # (day, time, initials, amount_remaining) rows grouped by day
+        self._entries_day_index = []
+        self._entries_by_day = defaultdict(list)
+
+        # (log tuples, display strings) last shown in log_combo
+        self._display_logs_cache = ((), ())
+
+        # Set while a background Excel export is running
+        self._exporting = False
+
+        # Whether the calendar (rather than the list) view is shown; its
+        # widgets are only built the first time it is shown
+        self._calendar_visible = False
+        self._calendar_built = False
+        self.calendar_mousewheel_binding = None
+
+        # Days whose entries changed since the last calendar refresh; None
+        # means the whole log changed and every day has to be recomputed
+        self._dirty_calendar_days = None
 
         # Dirty state tracking for unsaved changes
         self.profile_dirty = False
@@ -118,22 +241,36 @@ class MedicationTrackerApp:
         """Create menu bar"""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
-        
+
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        self._add_commands(file_menu, [("Exit", self.root.quit)])
 
-        # Export menu
+        # Export menu (filled in when first opened)
         export_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Export", menu=export_menu)
-        export_menu.add_command(label="Export Medication Log...", command=self.open_export_dialog)
+        export_menu.configure(postcommand=lambda: self._populate_menu(export_menu, [
+            ("Export Medication Log...", self.open_export_dialog)
+        ]))
 
-        # Help menu
+        # Help menu (filled in when first opened)
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self.show_about)
-    
+        help_menu.configure(postcommand=lambda: self._populate_menu(help_menu, [
+            ("About", self.show_about)
+        ]))
+
+    def _add_commands(self, menu, items):
+        """Add (label, command) pairs to a menu"""
+        for label, command in items:
+            menu.add_command(label=label, command=command)
+
+    def _populate_menu(self, menu, items):
+        """Fill a lazily built menu the first time it is posted"""
+        if menu.index(tk.END) is None:
+            self._add_commands(menu, items)
+
     def _create_main_layout(self):
         """Create main application layout with tabs"""
         # Create notebook (tabbed interface)
@@ -164,6 +301,9 @@ class MedicationTrackerApp:
         self.settings_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.settings_tab, text="Settings")
         self._create_settings_tab()
+
+        # Drop the calendar's global mousewheel binding when switching tabs
+        self.notebook.bind('<<NotebookTabChanged>>', lambda e: self._cleanup_calendar_bindings())
     
     def _create_profiles_tab(self):
         """Create profiles management tab"""
@@ -194,6 +334,7 @@ class MedicationTrackerApp:
         scrollbar.config(command=self.profile_listbox.yview)
 
         self.profile_listbox.bind('<<ListboxSelect>>', self.on_profile_select)
+        self._profile_listbox_names = []
 
         # Right panel - Profile details
         right_frame = ttk.Frame(paned)
@@ -240,14 +381,11 @@ class MedicationTrackerApp:
         data_location_frame = ttk.Frame(self.profiles_tab)
         data_location_frame.pack(fill=tk.X, padx=10, pady=5, side=tk.BOTTOM)
 
-        # Get data directory from profile manager
-        data_dir = self.profile_manager.data_dir
-
         # Label showing data location
         ttk.Label(data_location_frame, text="Data Location:",
                  font=self.NORMAL_FONT).pack(side=tk.LEFT, padx=5)
 
-        data_path_label = ttk.Label(data_location_frame, text=data_dir,
+        data_path_label = ttk.Label(data_location_frame, text=self.data_dir,
                                     font=self.NORMAL_FONT, foreground='blue')
         data_path_label.pack(side=tk.LEFT, padx=5)
 
@@ -262,7 +400,10 @@ class MedicationTrackerApp:
         top_frame.pack(fill=tk.X, padx=5, pady=5)
 
         ttk.Label(top_frame, text="Patient:").pack(side=tk.LEFT, padx=5)
-        self.med_card_profile_combo = ttk.Combobox(top_frame, width=30, state='readonly')
+        self.med_card_profile_var = tk.StringVar()
+        self._med_card_profile_values = ()
+        self.med_card_profile_combo = ttk.Combobox(top_frame, width=30, state='readonly',
+                                                   textvariable=self.med_card_profile_var)
         self.med_card_profile_combo.pack(side=tk.LEFT, padx=5)
         self.med_card_profile_combo.bind('<<ComboboxSelected>>', self.on_med_card_profile_select)
 
@@ -284,6 +425,8 @@ class MedicationTrackerApp:
         self.med_cards_listbox = tk.Listbox(left_frame, height=20)
         self.med_cards_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.med_cards_listbox.bind('<<ListboxSelect>>', self.on_med_card_select)
+        self._med_cards_listbox_names = []
+        self._med_cards_listbox_source = None  # (profile_id, card list version)
 
         # Right - Card details
         right_frame = ttk.LabelFrame(paned, text="Card Details")
@@ -309,6 +452,9 @@ class MedicationTrackerApp:
             entry.bind('<KeyRelease>', self.mark_med_card_dirty)
             self.med_card_fields[field_name] = entry
 
+        # (field_name, entry) pairs for the load/save loops
+        self._med_card_fields_seq = tuple(self.med_card_fields.items())
+
         form_frame.columnconfigure(1, weight=1)
 
         # Reason section
@@ -316,6 +462,7 @@ class MedicationTrackerApp:
         reason_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
         self.med_card_reason_type = tk.StringVar(value="prescribed")
+        self._last_med_card_reason_type = "prescribed"  # Reason shown in the text box
 
         ttk.Radiobutton(reason_frame, text="Reason Prescribed", variable=self.med_card_reason_type,
                         value="prescribed", command=self.on_med_card_reason_type_change).pack(anchor=tk.W)
@@ -324,7 +471,7 @@ class MedicationTrackerApp:
 
         self.med_card_reason_text = tk.Text(reason_frame, wrap=tk.WORD, height=3, width=50)
         self.med_card_reason_text.pack(fill=tk.BOTH, expand=True, pady=5)
-        self.med_card_reason_text.bind('<KeyRelease>', self.mark_med_card_dirty)
+        self._bind_text_modified(self.med_card_reason_text, self.mark_med_card_dirty)
 
         # Images section
         images_frame = ttk.LabelFrame(right_frame, text="Images")
@@ -347,7 +494,10 @@ class MedicationTrackerApp:
         top_frame.pack(fill=tk.X, padx=5, pady=5)
         
         ttk.Label(top_frame, text="Patient:").pack(side=tk.LEFT, padx=5)
-        self.log_profile_combo = ttk.Combobox(top_frame, width=30, state='readonly')
+        self.log_profile_var = tk.StringVar()
+        self._log_profile_values = ()
+        self.log_profile_combo = ttk.Combobox(top_frame, width=30, state='readonly',
+                                              textvariable=self.log_profile_var)
         self.log_profile_combo.pack(side=tk.LEFT, padx=5)
         self.log_profile_combo.bind('<<ComboboxSelected>>', self.on_log_profile_select)
         
@@ -378,7 +528,10 @@ class MedicationTrackerApp:
             entry.grid(row=0, column=i*2+1, sticky=tk.EW, padx=5, pady=5)
             entry.bind('<KeyRelease>', self.mark_log_dirty)
             self.log_fields[field_name] = entry
-        
+
+        # (field_name, entry) pairs for the load/save loops
+        self._log_fields_seq = tuple(self.log_fields.items())
+
         ttk.Button(details_frame, text="Save Med Info", command=self.save_medication_info).grid(
             row=0, column=6, padx=5, pady=5
         )
@@ -392,6 +545,7 @@ class MedicationTrackerApp:
         radio_frame.pack(fill=tk.X, padx=5, pady=5)
 
         self.reason_type = tk.StringVar(value="prescribed")
+        self._last_reason_type = "prescribed"  # Reason shown in the text box
 
         ttk.Radiobutton(radio_frame, text="Reason Prescribed", variable=self.reason_type,
                         value="prescribed", command=self.on_reason_type_change).pack(side=tk.LEFT, padx=5)
@@ -408,7 +562,7 @@ class MedicationTrackerApp:
 
         self.reason_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         reason_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.reason_text.bind('<KeyRelease>', self.mark_log_dirty)
+        self._bind_text_modified(self.reason_text, self.mark_log_dirty)
 
         # Save button for reason
         ttk.Button(reason_frame, text="Save Reason", command=self.save_reason).pack(pady=5)
@@ -474,9 +628,8 @@ class MedicationTrackerApp:
         self.entries_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Calendar view
+        # Calendar view (contents built on first use)
         self.calendar_view_frame = ttk.Frame(view_container)
-        self._create_calendar_grid()
 
         # Show list view by default
         self.list_view_frame.pack(fill=tk.BOTH, expand=True)
@@ -515,17 +668,57 @@ class MedicationTrackerApp:
         self.editor_status = ttk.Label(self.editor_tab, text="", foreground="blue")
         self.editor_status.pack(pady=5)
     
+    def _set_entry_text(self, entry, value):
+        """Replace an Entry's text, skipping the widget calls if it already matches"""
+        if entry.get() != value:
+            entry.delete(0, tk.END)
+            entry.insert(0, value)
+
+    def _sync_listbox(self, listbox, old_names, new_names):
+        """
+        Patch a listbox from old_names to new_names, touching only changed rows
+
+        Returns:
+            The new snapshot of listbox contents
+        """
+        opcodes = difflib.SequenceMatcher(None, old_names, new_names, autojunk=False).get_opcodes()
+
+        # Apply from the end so earlier indices stay valid
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == 'equal':
+                continue
+            if i2 > i1:
+                listbox.delete(i1, i2 - 1)
+            if j2 > j1:
+                listbox.insert(i1, *new_names[j1:j2])
+
+        return list(new_names)
+
     # Profile methods
+    def _refresh_profile_caches(self):
+        """Snapshot the profile list and rebuild name/id lookups"""
+        self._profile_list = tuple(self.profile_manager.get_profile_list())
+        self._profiles_by_id = dict(self._profile_list)
+
+        # First profile wins when two share a display name (matches list order)
+        self._profiles_by_name = {}
+        for profile_id, child_name in self._profile_list:
+            self._profiles_by_name.setdefault(child_name, profile_id)
+
     def refresh_profile_list(self):
         """Refresh the profile listbox"""
-        self.profile_listbox.delete(0, tk.END)
-
-        profiles = self.profile_manager.get_profile_list()
-        for profile_id, child_name in profiles:
-            self.profile_listbox.insert(tk.END, child_name)
+        self._refresh_profile_caches()
+        profiles = self._profile_list
+        self._profile_listbox_names = self._sync_listbox(
+            self.profile_listbox, self._profile_listbox_names,
+            [child_name for _, child_name in profiles]
+        )
 
-        # Update log profile combo
-        self.log_profile_combo['values'] = [name for _, name in profiles]
+        # Update log profile combo (skip when unchanged to keep dropdown state)
+        names = tuple(name for _, name in profiles)
+        if names != self._log_profile_values:
+            self.log_profile_combo['values'] = names
+            self._log_profile_values = names
 
         # Update medication cards profile combo
         self.refresh_med_card_profile_list()
@@ -535,9 +728,8 @@ class MedicationTrackerApp:
         # Check for unsaved changes
         if not self.check_unsaved_profile_changes():
             # User cancelled, revert selection
-            if hasattr(self, 'current_profile_id') and self.current_profile_id:
-                profiles = self.profile_manager.get_profile_list()
-                for i, (pid, _) in enumerate(profiles):
+            if self.current_profile_id:
+                for i, (pid, _) in enumerate(self._profile_list):
                     if pid == self.current_profile_id:
                         self.profile_listbox.selection_clear(0, tk.END)
                         self.profile_listbox.selection_set(i)
@@ -549,7 +741,7 @@ class MedicationTrackerApp:
             return
 
         idx = selection[0]
-        profiles = self.profile_manager.get_profile_list()
+        profiles = self._profile_list
 
         if idx < len(profiles):
             profile_id, _ = profiles[idx]
@@ -562,8 +754,7 @@ class MedicationTrackerApp:
 
         if profile:
             for field_name, entry in self.profile_fields.items():
-                entry.delete(0, tk.END)
-                entry.insert(0, profile.get(field_name, ''))
+                self._set_entry_text(entry, profile.get(field_name, ''))
             # Clear dirty flag after loading
             self.profile_dirty = False
     
@@ -632,40 +823,49 @@ class MedicationTrackerApp:
     # Medication Card methods
     def refresh_med_card_profile_list(self):
         """Refresh medication card profile combo"""
-        profiles = self.profile_manager.get_profile_list()
-        self.med_card_profile_combo['values'] = [name for _, name in profiles]
+        names = tuple(name for _, name in self._profile_list)
+        if names != self._med_card_profile_values:
+            self.med_card_profile_combo['values'] = names
+            self._med_card_profile_values = names
 
     def on_med_card_profile_select(self, event):
         """Handle profile selection in medication cards tab"""
         # Check for unsaved changes
         if not self.check_unsaved_med_card_changes():
             # User cancelled, revert selection
-            if hasattr(self, 'current_med_card_profile_id'):
-                profiles = self.profile_manager.get_profile_list()
-                for profile_id, child_name in profiles:
-                    if profile_id == self.current_med_card_profile_id:
-                        self.med_card_profile_combo.set(child_name)
-                        break
+            child_name = self._profiles_by_id.get(self.current_med_card_profile_id)
+            if child_name is not None:
+                self.med_card_profile_var.set(child_name)
             return
 
-        selected_name = self.med_card_profile_combo.get()
-
-        # Find profile ID
-        profiles = self.profile_manager.get_profile_list()
-        for profile_id, child_name in profiles:
-            if child_name == selected_name:
-                self.current_med_card_profile_id = profile_id
-                self.load_medication_cards(profile_id)
-                break
+        profile_id = self._profiles_by_name.get(self.med_card_profile_var.get())
+        if profile_id is not None:
+            self.current_med_card_profile_id = profile_id
+            self.load_medication_cards(profile_id)
 
     def load_medication_cards(self, profile_id):
         """Load medication cards for selected profile"""
-        self.med_cards_listbox.delete(0, tk.END)
+        # Skip the reload if this profile's card list is already shown
+        version = self.medication_card_manager.get_version(profile_id)
+        if self._med_cards_listbox_source == (profile_id, version):
+            return
+        self._med_cards_listbox_source = (profile_id, version)
+
         self.current_med_card = None
 
         card_names = self.medication_card_manager.list_cards(profile_id)
-        for name in card_names:
-            self.med_cards_listbox.insert(tk.END, name)
+        self._med_cards_listbox_names = self._sync_listbox(
+            self.med_cards_listbox, self._med_cards_listbox_names, card_names
+        )
+        self.med_cards_listbox.selection_clear(0, tk.END)
+
+    def _med_card_listbox_index(self, medicine_name):
+        """Row of a card in med_cards_listbox (names are kept sorted), or None"""
+        names = self._med_cards_listbox_names
+        index = bisect_left(names, medicine_name)
+        if index < len(names) and names[index] == medicine_name:
+            return index
+        return None
 
     def on_med_card_select(self, event):
         """Handle medication card selection"""
@@ -673,10 +873,8 @@ class MedicationTrackerApp:
         if not self.check_unsaved_med_card_changes():
             # User cancelled, revert selection
             if self.current_med_card:
-                cards = list(self.medication_card_manager.get_all_cards(self.current_med_card_profile_id).keys())
-                current_name = self.current_med_card.get('medicine_name', '')
-                if current_name in cards:
-                    index = cards.index(current_name)
+                index = self._med_card_listbox_index(self.current_med_card.get('medicine_name', ''))
+                if index is not None:
                     self.med_cards_listbox.selection_clear(0, tk.END)
                     self.med_cards_listbox.selection_set(index)
             return
@@ -688,7 +886,7 @@ class MedicationTrackerApp:
         idx = selection[0]
         medicine_name = self.med_cards_listbox.get(idx)
 
-        if hasattr(self, 'current_med_card_profile_id'):
+        if self.current_med_card_profile_id is not None:
             card = self.medication_card_manager.get_card(self.current_med_card_profile_id, medicine_name)
             if card:
                 self.current_med_card = card
@@ -697,19 +895,17 @@ class MedicationTrackerApp:
     def load_med_card_to_form(self, card):
         """Load medication card data into form"""
         # Load basic fields
-        for field_name, entry in self.med_card_fields.items():
-            entry.delete(0, tk.END)
-            entry.insert(0, card.get(field_name, ''))
+        for field_name, entry in self._med_card_fields_seq:
+            self._set_entry_text(entry, card.get(field_name, ''))
 
         # Intelligently select which reason to show
         reason_prescribed = card.get('reason_prescribed', '').strip()
         reason_prn = card.get('reason_prn', '').strip()
 
         # If only PRN has content, show that; otherwise default to prescribed
-        if reason_prn and not reason_prescribed:
-            self.med_card_reason_type.set("prn")
-        else:
-            self.med_card_reason_type.set("prescribed")
+        reason_type = "prn" if reason_prn and not reason_prescribed else "prescribed"
+        self.med_card_reason_type.set(reason_type)
+        self._last_med_card_reason_type = reason_type
 
         # Load reason
         self.load_med_card_reason_text(card)
@@ -730,14 +926,20 @@ class MedicationTrackerApp:
             text = card.get('reason_prn', '')
 
         self.med_card_reason_text.insert('1.0', text)
+        self.med_card_reason_text.edit_modified(False)  # Loading is not an edit
 
     def on_med_card_reason_type_change(self):
         """Handle reason type change in medication card"""
+        reason_type = self.med_card_reason_type.get()
+        if reason_type == self._last_med_card_reason_type:
+            return
+        self._last_med_card_reason_type = reason_type
+
         if self.current_med_card:
             # Save current text
             text = self.med_card_reason_text.get('1.0', tk.END).strip()
 
-            if self.med_card_reason_type.get() == "prescribed":
+            if reason_type == "prescribed":
                 self.current_med_card['reason_prn'] = text
             else:
                 self.current_med_card['reason_prescribed'] = text
@@ -749,12 +951,13 @@ class MedicationTrackerApp:
         """Refresh images list"""
         self.med_card_images_listbox.delete(0, tk.END)
 
-        for image_name in card.get('images', []):
-            self.med_card_images_listbox.insert(tk.END, image_name)
+        images = card.get('images', ())
+        if images:
+            self.med_card_images_listbox.insert(tk.END, *images)
 
     def create_new_medication_card(self):
         """Create new medication card"""
-        if not hasattr(self, 'current_med_card_profile_id'):
+        if self.current_med_card_profile_id is None:
             messagebox.showwarning("Warning", "Please select a patient first")
             return
 
@@ -763,38 +966,41 @@ class MedicationTrackerApp:
             return
 
         # Clear form
-        for entry in self.med_card_fields.values():
+        for _, entry in self._med_card_fields_seq:
             entry.delete(0, tk.END)
 
         self.med_card_reason_text.delete('1.0', tk.END)
+        self.med_card_reason_text.edit_modified(False)
         self.med_card_images_listbox.delete(0, tk.END)
         self.current_med_card = None
         self.med_card_dirty = False
 
     def save_medication_card(self):
         """Save medication card (create or update)"""
-        if not hasattr(self, 'current_med_card_profile_id'):
+        if self.current_med_card_profile_id is None:
             messagebox.showwarning("Warning", "Please select a patient first")
             return
 
         # Get form data
         card_data = {}
-        for field_name, entry in self.med_card_fields.items():
+        for field_name, entry in self._med_card_fields_seq:
             card_data[field_name] = entry.get().strip()
 
         if not card_data.get('medicine_name'):
             messagebox.showerror("Error", "Medicine Name is required")
             return
 
-        # Get reason data
+        # Get reason data: the text box holds the shown reason, the other
+        # one comes from the loaded card
         reason_text = self.med_card_reason_text.get('1.0', tk.END).strip()
+        current_card = self.current_med_card or {}
 
-        if self.med_card_reason_type.get() == "prescribed":
+        if self._last_med_card_reason_type == "prescribed":
             card_data['reason_prescribed'] = reason_text
-            card_data['reason_prn'] = self.current_med_card.get('reason_prn', '') if self.current_med_card else ''
+            card_data['reason_prn'] = current_card.get('reason_prn', '')
         else:
             card_data['reason_prn'] = reason_text
-            card_data['reason_prescribed'] = self.current_med_card.get('reason_prescribed', '') if self.current_med_card else ''
+            card_data['reason_prescribed'] = current_card.get('reason_prescribed', '')
 
         try:
             if self.current_med_card is None:
@@ -805,6 +1011,7 @@ class MedicationTrackerApp:
                 # Update existing
                 medicine_name = card_data['medicine_name']
                 self.medication_card_manager.update_card(self.current_med_card_profile_id, medicine_name, card_data)
+                self.current_med_card.update(card_data)
                 messagebox.showinfo("Success", "Medication card updated")
 
             self.load_medication_cards(self.current_med_card_profile_id)
@@ -826,9 +1033,11 @@ class MedicationTrackerApp:
         base_name = original_name
         new_name = f"{base_name} - Copy"
 
-        # Check if name already exists, and add numbers if needed
+        # Check if name already exists (against one snapshot of the
+        # profile's cards), and add numbers if needed
+        existing = set(self.medication_card_manager.get_all_cards(self.current_med_card_profile_id))
         counter = 2
-        while self.medication_card_manager.get_card(self.current_med_card_profile_id, new_name):
+        while new_name in existing:
             new_name = f"{base_name} - Copy {counter}"
             counter += 1
 
@@ -848,9 +1057,8 @@ class MedicationTrackerApp:
             self.load_medication_cards(self.current_med_card_profile_id)
 
             # Select the new card
-            cards = list(self.medication_card_manager.get_all_cards(self.current_med_card_profile_id).keys())
-            if new_name in cards:
-                index = cards.index(new_name)
+            index = self._med_card_listbox_index(new_name)
+            if index is not None:
                 self.med_cards_listbox.selection_clear(0, tk.END)
                 self.med_cards_listbox.selection_set(index)
                 self.med_cards_listbox.see(index)
@@ -942,13 +1150,8 @@ class MedicationTrackerApp:
                 filename
             )
 
-            # Open image in default application
-            if sys.platform == 'win32':
-                os.startfile(image_path)
-            elif sys.platform == 'darwin':
-                os.system(f'open "{image_path}"')
-            else:
-                os.system(f'xdg-open "{image_path}"')
+            # Open image in default application (no shell, does not block)
+            _open_path(image_path)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to view image: {e}")
@@ -994,31 +1197,30 @@ class MedicationTrackerApp:
         # Check for unsaved changes
         if not self.check_unsaved_log_changes():
             # User cancelled, revert selection
-            if hasattr(self, 'current_profile_id') and self.current_profile_id:
-                profiles = self.profile_manager.get_profile_list()
-                for profile_id, child_name in profiles:
-                    if profile_id == self.current_profile_id:
-                        self.log_profile_combo.set(child_name)
-                        break
+            if self.current_profile_id:
+                child_name = self._profiles_by_id.get(self.current_profile_id)
+                if child_name is not None:
+                    self.log_profile_var.set(child_name)
             return
 
-        selected_name = self.log_profile_combo.get()
-
         # Find profile ID
-        profiles = self.profile_manager.get_profile_list()
-        for profile_id, child_name in profiles:
-            if child_name == selected_name:
-                self.current_profile_id = profile_id
-                self.load_logs_for_profile(profile_id)
-                break
+        profile_id = self._profiles_by_name.get(self.log_profile_var.get())
+        if profile_id is not None:
+            self.current_profile_id = profile_id
+            self.load_logs_for_profile(profile_id)
 
     def load_logs_for_profile(self, profile_id):
         """Load available logs for selected profile"""
         logs = self.log_manager.list_logs_for_profile(profile_id)  # Returns list of (medicine_name, month_year) tuples
 
-        # Format for display: "Medicine Name - Month Year"
-        display_logs = [f"{med} - {month}" for med, month in logs]
-        self.log_combo['values'] = display_logs
+        # Format for display: "Medicine Name - Month Year" (reused while the
+        # log list is unchanged)
+        logs_key = tuple(logs)
+        if logs_key != self._display_logs_cache[0]:
+            display_logs = tuple(f"{med} - {month}" for med, month in logs)
+            self._display_logs_cache = (logs_key, display_logs)
+            self.log_combo['values'] = display_logs
+            self._available_logs_index = {pair: i for i, pair in enumerate(logs_key)}
 
         # Store the tuples for later reference
         self.available_logs = logs
@@ -1032,11 +1234,9 @@ class MedicationTrackerApp:
         # Check for unsaved changes
         if not self.check_unsaved_log_changes():
             # User cancelled, revert selection
-            if hasattr(self, 'current_medicine_name') and self.current_medicine_name and hasattr(self, 'current_month_year') and self.current_month_year:
-                for i, (med, month) in enumerate(self.available_logs):
-                    if med == self.current_medicine_name and month == self.current_month_year:
-                        self.log_combo.current(i)
-                        break
+            idx = self._available_logs_index.get((self.current_medicine_name, self.current_month_year))
+            if idx is not None:
+                self.log_combo.current(idx)
             return
 
         idx = self.log_combo.current()
@@ -1078,10 +1278,7 @@ class MedicationTrackerApp:
         # Month and Year selection
         ttk.Label(dialog, text="Month:").grid(row=2, column=0, padx=10, pady=10, sticky=tk.W)
 
-        months = ['January', 'February', 'March', 'April', 'May', 'June',
-                 'July', 'August', 'September', 'October', 'November', 'December']
-
-        month_combo = ttk.Combobox(dialog, width=12, values=months, state='readonly')
+        month_combo = ttk.Combobox(dialog, width=12, values=self.MONTHS, state='readonly')
         month_combo.grid(row=2, column=1, padx=10, pady=10, sticky=tk.W)
         month_combo.current(datetime.now().month - 1)  # Set to current month
 
@@ -1175,12 +1372,13 @@ class MedicationTrackerApp:
             return
 
         self.current_log = self.log_manager.get_log(self.current_profile_id, self.current_medicine_name, self.current_month_year)
+        self._entries_version += 1
+        self._dirty_calendar_days = None
 
         if self.current_log:
             # Load medication info
-            for field_name, entry in self.log_fields.items():
-                entry.delete(0, tk.END)
-                entry.insert(0, self.current_log.get(field_name, ''))
+            for field_name, entry in self._log_fields_seq:
+                self._set_entry_text(entry, self.current_log.get(field_name, ''))
 
             # Load reason based on current selection
             self.load_reason_text()
@@ -1197,7 +1395,7 @@ class MedicationTrackerApp:
             messagebox.showwarning("Warning", "No log loaded")
             return
 
-        for field_name, entry in self.log_fields.items():
+        for field_name, entry in self._log_fields_seq:
             self.current_log[field_name] = entry.get().strip()
 
         self.log_manager.save_log(self.current_profile_id, self.current_medicine_name, self.current_month_year, self.current_log)
@@ -1206,11 +1404,16 @@ class MedicationTrackerApp:
 
     def on_reason_type_change(self):
         """Handle reason type radio button change"""
+        if self.reason_type.get() == self._last_reason_type:
+            return
+
         if self.current_log:
             # Save current text before switching
             self.save_current_reason_to_log()
-            # Load the other reason type
-            self.load_reason_text()
+        self._last_reason_type = self.reason_type.get()
+
+        # Load the other reason type
+        self.load_reason_text()
 
     def load_reason_text(self):
         """Load the appropriate reason text based on radio button selection"""
@@ -1225,6 +1428,7 @@ class MedicationTrackerApp:
             text = self.current_log.get('reason_prn', '')
 
         self.reason_text.insert('1.0', text)
+        self.reason_text.edit_modified(False)  # Loading is not an edit
 
     def save_current_reason_to_log(self):
         """Save current reason text to the log data (without persisting to file)"""
@@ -1233,7 +1437,8 @@ class MedicationTrackerApp:
 
         text = self.reason_text.get('1.0', tk.END).strip()
 
-        if self.reason_type.get() == "prescribed":
+        # The text box still holds the reason that was last loaded into it
+        if self._last_reason_type == "prescribed":
             self.current_log['reason_prescribed'] = text
         else:
             self.current_log['reason_prn'] = text
@@ -1254,26 +1459,57 @@ class MedicationTrackerApp:
     
     def refresh_entries_list(self):
         """Refresh the administration entries treeview and calendar view"""
-        # Clear existing
-        for item in self.entries_tree.get_children():
-            self.entries_tree.delete(item)
+        # Nothing to do if the entries have not changed since the last refresh
+        if self._entries_rendered_version == self._entries_version:
+            return
+        self._entries_rendered_version = self._entries_version
+
+        # Drop any fill still pending from a previous refresh
+        if self._entries_fill_after_id is not None:
+            self.root.after_cancel(self._entries_fill_after_id)
+            self._entries_fill_after_id = None
+
+        # Clear existing in a single call
+        tree = self.entries_tree
+        tree.delete(*tree.get_children())
+        self._entries_day_index = []
+        self._entries_by_day = defaultdict(list)
 
         if not self.current_log:
             return
 
-        # Add entries
+        # Each row's iid is its index in administration_log; also group the
+        # rows by day and record each one's position within its day
+        entries_by_day = self._entries_by_day
+        day_index = self._entries_day_index
+        rows = []
         for entry in self.current_log.get('administration_log', []):
-            self.entries_tree.insert('', tk.END, values=(
-                entry.get('day', ''),
-                entry.get('time', ''),
-                entry.get('initials', ''),
-                entry.get('amount_remaining', '')
-            ))
+            row = (entry.get('day', ''), entry.get('time', ''),
+                   entry.get('initials', ''), entry.get('amount_remaining', ''))
+            day_entries = entries_by_day[row[0]]
+            day_index.append(len(day_entries))
+            day_entries.append(row)
+            rows.append(row)
+
+        # Add entries (first chunk now, the rest during idle time)
+        self._fill_entries_tree(rows, 0)
 
         # Also refresh calendar view if it's visible
-        if self.view_mode.get() == "calendar":
+        if self._calendar_visible:
             self.refresh_calendar_view()
     
+    def _fill_entries_tree(self, rows, start):
+        """Insert one chunk of rows into entries_tree and schedule the next"""
+        end = start + self.ENTRIES_CHUNK_SIZE
+        insert = self.entries_tree.insert
+        for index in range(start, min(end, len(rows))):
+            insert('', 'end', iid=str(index), values=rows[index])
+
+        if end < len(rows):
+            self._entries_fill_after_id = self.root.after_idle(self._fill_entries_tree, rows, end)
+        else:
+            self._entries_fill_after_id = None
+
     def add_administration_entry(self):
         """Add new administration entry"""
         if not self.current_log:
@@ -1300,8 +1536,9 @@ class MedicationTrackerApp:
             return
         
         try:
-            self.log_manager.add_entry(self.current_profile_id, self.current_medicine_name, self.current_month_year, entry_data)
-            self.current_log = self.log_manager.get_log(self.current_profile_id, self.current_medicine_name, self.current_month_year)
+            self.current_log = self.log_manager.add_entry(self.current_profile_id, self.current_medicine_name, self.current_month_year, entry_data)
+            self._entries_version += 1
+            self._mark_calendar_day_dirty(day)
             self.refresh_entries_list()
             
             # Clear entry fields
@@ -1319,27 +1556,19 @@ class MedicationTrackerApp:
             messagebox.showwarning("Warning", "No entry selected")
             return
         
-        item = self.entries_tree.item(selection[0])
-        values = item['values']
-        day = int(values[0])
-        
-        # Find which entry it is for this day
-        day_entries = [e for e in self.current_log.get('administration_log', []) if e['day'] == day]
-        
-        # Match by all fields
-        for idx, entry in enumerate(day_entries):
-            if (entry.get('time') == values[1] and 
-                entry.get('initials') == values[2] and
-                entry.get('amount_remaining') == values[3]):
-                
-                if messagebox.askyesno("Confirm", f"Delete entry for Day {day}?"):
-                    try:
-                        self.log_manager.delete_entry(self.current_profile_id, self.current_medicine_name, self.current_month_year, day, idx)
-                        self.current_log = self.log_manager.get_log(self.current_profile_id, self.current_medicine_name, self.current_month_year)
-                        self.refresh_entries_list()
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Failed to delete entry: {e}")
-                break
+        # The iid is the entry's index in administration_log
+        log_index = int(selection[0])
+        day = self.current_log['administration_log'][log_index]['day']
+        idx = self._entries_day_index[log_index]
+
+        if messagebox.askyesno("Confirm", f"Delete entry for Day {day}?"):
+            try:
+                self.current_log = self.log_manager.delete_entry(self.current_profile_id, self.current_medicine_name, self.current_month_year, day, idx)
+                self._entries_version += 1
+                self._mark_calendar_day_dirty(day)
+                self.refresh_entries_list()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to delete entry: {e}")
     
     def clear_day_entries(self):
         """Clear all entries for a specific day"""
@@ -1351,7 +1580,7 @@ class MedicationTrackerApp:
             messagebox.showerror("Error", "Invalid day (must be 1-31)")
             return
         
-        day_entries = [e for e in self.current_log.get('administration_log', []) if e['day'] == day]
+        day_entries = self._entries_by_day.get(day, ())
         
         if not day_entries:
             messagebox.showinfo("Info", f"No entries for day {day}")
@@ -1359,8 +1588,9 @@ class MedicationTrackerApp:
         
         if messagebox.askyesno("Confirm", f"Delete all {len(day_entries)} entries for day {day}?"):
             try:
-                self.log_manager.delete_all_entries_for_day(self.current_profile_id, self.current_medicine_name, self.current_month_year, day)
-                self.current_log = self.log_manager.get_log(self.current_profile_id, self.current_medicine_name, self.current_month_year)
+                self.current_log = self.log_manager.delete_all_entries_for_day(self.current_profile_id, self.current_medicine_name, self.current_month_year, day)
+                self._entries_version += 1
+                self._mark_calendar_day_dirty(day)
                 self.refresh_entries_list()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to clear entries: {e}")
@@ -1385,9 +1615,7 @@ class MedicationTrackerApp:
 
     # Calendar View methods
     def _create_calendar_grid(self):
-        """Create the calendar grid for displaying entries"""
-        import calendar
-
+        """Create the calendar canvas for displaying entries"""
         # Calendar header (month/year)
         header_frame = ttk.Frame(self.calendar_view_frame)
         header_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -1395,31 +1623,13 @@ class MedicationTrackerApp:
         self.calendar_month_label = ttk.Label(header_frame, text="", font=self.CALENDAR_MONTH_FONT)
         self.calendar_month_label.pack()
 
-        # Create scrollable canvas for calendar
+        # Whole month is drawn onto a single scrollable canvas
         canvas_frame = ttk.Frame(self.calendar_view_frame)
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        canvas = tk.Canvas(canvas_frame, highlightthickness=0)
+        canvas = tk.Canvas(canvas_frame, highlightthickness=0, bg=self.CALENDAR_DEFAULT_BG, cursor='hand2')
         scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=canvas.yview)
-
-        # Frame to hold the calendar grid
-        days_frame = ttk.Frame(canvas)
-
-        # Configure canvas scrolling
         canvas.configure(yscrollcommand=scrollbar.set)
-        canvas_window = canvas.create_window((0, 0), window=days_frame, anchor=tk.NW)
-
-        def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Update canvas window width to match canvas width
-            canvas.itemconfig(canvas_window, width=event.width)
-
-        def on_canvas_configure(event):
-            # Update canvas window width when canvas is resized
-            canvas.itemconfig(canvas_window, width=event.width)
-
-        days_frame.bind('<Configure>', on_frame_configure)
-        canvas.bind('<Configure>', on_canvas_configure)
 
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -1428,96 +1638,211 @@ class MedicationTrackerApp:
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
-        # Store handler for cleanup
+        # Store handler for cleanup; the global binding only exists while
+        # the pointer is over the canvas
         self.calendar_mousewheel_handler = on_mousewheel
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        canvas.bind('<Enter>', self._bind_calendar_mousewheel)
+        canvas.bind('<Leave>', lambda e: self._cleanup_calendar_bindings())
 
-        # Day headers
-        day_headers = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
+        # Re-layout on resize so cells follow the canvas width
+        canvas.bind('<Configure>', lambda e: self._layout_calendar())
+
+        # One click binding for the whole calendar
+        canvas.bind('<Button-1>', self._on_calendar_canvas_click)
+
+        # Store canvas reference for cleanup
+        self.calendar_canvas = canvas
+
+        # Canvas items are created once (7 headers, 6 weeks x 7 days) and
+        # then only moved on resize or reconfigured on refresh
+        self._calendar_header_items = [
+            (canvas.create_rectangle(0, 0, 0, 0, outline='#a0a0a0'),
+             canvas.create_text(0, 0, text=day_name, font=self.HEADING_FONT))
+            for day_name in ('Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat')
+        ]
+        self._calendar_cell_items = [
+            [(canvas.create_rectangle(0, 0, 0, 0, outline='#a0a0a0', state=tk.HIDDEN),
+              canvas.create_text(0, 0, anchor=tk.NW, font=self.HEADING_FONT, state=tk.HIDDEN),
+              canvas.create_text(0, 0, anchor=tk.NW, font=self.SMALL_FONT,
+                                 justify=tk.LEFT, state=tk.HIDDEN))
+             for _ in range(7)]
+            for _ in range(6)
+        ]
+        self._calendar_cell_w = None
+
+        # Tcl helper that configures a day cell's items in a single call
+        canvas.tk.eval(
+            'proc ' + self.CALENDAR_CELL_PROC +
+            ' {canvas rect label entries fill rect_state day text text_state} {\n'
+            '    $canvas itemconfigure $rect -fill $fill -state $rect_state\n'
+            '    $canvas itemconfigure $label -text $day -state $text_state\n'
+            '    $canvas itemconfigure $entries -text $text -state $text_state\n'
+            '}'
+        )
+
+        # Last applied (day, entry text) per cell; None while the cell's
+        # week is hidden
+        self._calendar_cell_state = [[None] * 7 for _ in range(6)]
+
+        # Month layout (from calendar.monthcalendar) and entry text per day
+        self._calendar_weeks = []
+        self._calendar_month = None
+        self._calendar_day_text = {}
 
-        # Configure grid columns for equal sizing
-        for i in range(7):
-            days_frame.columnconfigure(i, weight=1, minsize=80)
+        # Day of the month -> (row, col) of its cell
+        self._calendar_day_items = {}
+
+    def _layout_calendar(self):
+        """Position the calendar items for the current canvas width"""
+        canvas = self.calendar_canvas
+        cell_w = max(canvas.winfo_width() // 7, self.CALENDAR_MIN_CELL_WIDTH)
+        if cell_w == self._calendar_cell_w:
+            return
+        self._calendar_cell_w = cell_w
+
+        cell_h = self.CALENDAR_CELL_HEIGHT
+        top = self.CALENDAR_HEADER_HEIGHT
 
         # Day headers
-        for col, day in enumerate(day_headers):
-            header = ttk.Label(days_frame, text=day, font=self.HEADING_FONT,
-                             anchor=tk.CENTER, relief=tk.RIDGE)
-            header.grid(row=0, column=col, sticky='ew', padx=1, pady=1)
+        for col, (rect, text) in enumerate(self._calendar_header_items):
+            x0 = col * cell_w
+            canvas.coords(rect, x0 + 1, 1, x0 + cell_w - 1, top - 1)
+            canvas.coords(text, x0 + cell_w // 2, top // 2)
+
+        # Day cells
+        for row, week_items in enumerate(self._calendar_cell_items):
+            y0 = top + row * cell_h
+            for col, (rect, day_label, entries) in enumerate(week_items):
+                x0 = col * cell_w
+                canvas.coords(rect, x0 + 1, y0 + 1, x0 + cell_w - 1, y0 + cell_h - 1)
+                canvas.coords(day_label, x0 + 4, y0 + 3)
+                canvas.coords(entries, x0 + 4, y0 + 22)
+                canvas.itemconfigure(entries, width=cell_w - 8)
+
+        canvas.configure(scrollregion=(0, 0, 7 * cell_w, top + len(self._calendar_weeks) * cell_h))
+
+    def _draw_calendar(self):
+        """Show the current month's days and entries in the calendar cells"""
+        canvas = self.calendar_canvas
+        day_items = self._calendar_day_items = {}
+        day_text = self._calendar_day_text
+        weeks = self._calendar_weeks
+
+        for row in range(6):
+            if row >= len(weeks):
+                # Month has fewer weeks than the grid
+                for col in range(7):
+                    self._set_calendar_cell(row, col, None)
+                continue
+
+            for col, day in enumerate(weeks[row]):
+                if day:
+                    day_items[day] = (row, col)
+                self._set_calendar_cell(row, col, (day, day_text.get(day, '')))
+
+        # Scroll region depends on the number of weeks shown
+        if self._calendar_cell_w is None:
+            self._layout_calendar()
+        else:
+            canvas.configure(scrollregion=(0, 0, 7 * self._calendar_cell_w,
+                                           self.CALENDAR_HEADER_HEIGHT + len(weeks) * self.CALENDAR_CELL_HEIGHT))
 
-        # Calendar cells storage
-        self.calendar_cells = {}
+    def _mark_calendar_day_dirty(self, day):
+        """Record that a day's entries changed since the last calendar refresh"""
+        if self._dirty_calendar_days is not None:
+            self._dirty_calendar_days.add(day)
 
-        # Store canvas reference for cleanup
-        self.calendar_canvas = canvas
-        self.calendar_mousewheel_binding = None
+    def _set_calendar_cell(self, row, col, state):
+        """Apply a (day, entry text) state to a calendar cell if it changed"""
+        if self._calendar_cell_state[row][col] == state:
+            return
+        self._calendar_cell_state[row][col] = state
 
-        # Create 5 rows of 7 cells for the calendar
-        for row in range(1, 6):
-            for col in range(7):
-                cell_frame = tk.Frame(days_frame, relief=tk.RIDGE, borderwidth=1,
-                                    bg='white', cursor='hand2', height=60)
-                cell_frame.grid(row=row, column=col, sticky='ew', padx=1, pady=1)
-                cell_frame.grid_propagate(False)  # Don't shrink to fit content
-
-                # Day number label
-                day_label = tk.Label(cell_frame, text="", font=self.HEADING_FONT,
-                                   bg='white', anchor=tk.NW)
-                day_label.pack(anchor=tk.NW, padx=2, pady=2)
-
-                # Entries container with wrapping
-                entries_label = tk.Label(cell_frame, text="", font=self.SMALL_FONT,
-                                       bg='white', anchor=tk.NW, justify=tk.LEFT,
-                                       wraplength=70)
-                entries_label.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-
-                # Store references including event handler
-                self.calendar_cells[(row-1, col)] = {
-                    'frame': cell_frame,
-                    'day_label': day_label,
-                    'entries_label': entries_label,
-                    'day_num': 0,
-                    'click_handler': None  # Store click handler for cleanup
-                }
+        canvas = self.calendar_canvas
+        rect, day_label, entries = self._calendar_cell_items[row][col]
+
+        # (fill, rectangle state, day number, entry text, text state)
+        if state is None:
+            # Week not used by this month
+            cell = (self.CALENDAR_DEFAULT_BG, tk.HIDDEN, '', '', tk.HIDDEN)
+        else:
+            day, entry_text = state
+            if day == 0:
+                # Empty cell (day from prev/next month)
+                cell = (self.CALENDAR_EMPTY_BG, tk.NORMAL, '', '', tk.HIDDEN)
+            else:
+                # Highlight days that have entries
+                fill = self.CALENDAR_ACTIVE_BG if entry_text else self.CALENDAR_DEFAULT_BG
+                cell = (fill, tk.NORMAL, day, entry_text, tk.NORMAL)
+
+        # One interpreter call configures all three items of the cell
+        canvas.tk.call(self.CALENDAR_CELL_PROC, str(canvas), rect, day_label, entries, *cell)
+
+    def _redraw_calendar_days(self, days):
+        """Update the cells of the given days without redrawing the month"""
+        for day in days:
+            position = self._calendar_day_items.get(day)
+            if position is not None:
+                self._set_calendar_cell(*position, (day, self._calendar_day_text.get(day, '')))
+
+    def _on_calendar_canvas_click(self, event):
+        """Map a click on the calendar canvas to the day under the cursor"""
+        if not self._calendar_cell_w:
+            return
+
+        canvas = self.calendar_canvas
+        col = int(canvas.canvasx(event.x) // self._calendar_cell_w)
+        y = canvas.canvasy(event.y) - self.CALENDAR_HEADER_HEIGHT
+        if y < 0 or not 0 <= col < 7:
+            return
+
+        row = int(y // self.CALENDAR_CELL_HEIGHT)
+        if row < len(self._calendar_weeks):
+            day = self._calendar_weeks[row][col]
+            if day:
+                self.on_calendar_day_click(day)
 
     def toggle_view_mode(self):
         """Toggle between list and calendar view"""
-        if self.view_mode.get() == "list":
+        self._calendar_visible = self.view_mode.get() == "calendar"
+
+        if not self._calendar_visible:
             # Cleanup calendar view bindings when switching away
             self._cleanup_calendar_bindings()
             self.calendar_view_frame.pack_forget()
             self.list_view_frame.pack(fill=tk.BOTH, expand=True)
         else:
+            if not self._calendar_built:
+                self._create_calendar_grid()
+                self._calendar_built = True
             self.list_view_frame.pack_forget()
             self.calendar_view_frame.pack(fill=tk.BOTH, expand=True)
-            self.refresh_calendar_view()
+            # Skip the refresh if the log hasn't changed since the last draw
+            # (None means the whole log was replaced)
+            if self._dirty_calendar_days is None or self._dirty_calendar_days:
+                self.refresh_calendar_view()
+
+    def _bind_calendar_mousewheel(self, event=None):
+        """Route mousewheel events to the calendar canvas"""
+        if self.calendar_mousewheel_binding is None:
+            self.calendar_mousewheel_binding = self.calendar_canvas.bind_all(
+                "<MouseWheel>", self.calendar_mousewheel_handler
+            )
 
     def _cleanup_calendar_bindings(self):
         """Cleanup calendar view event bindings to prevent memory leaks"""
-        # Unbind mousewheel handler
-        if hasattr(self, 'calendar_mousewheel_handler') and self.calendar_mousewheel_handler:
+        # Unbind mousewheel handler and free the Tcl command that bind_all
+        # registered for it (unbind_all alone leaves it behind)
+        if self.calendar_mousewheel_binding is not None:
             try:
                 self.root.unbind_all("<MouseWheel>")
+                self.calendar_canvas.deletecommand(self.calendar_mousewheel_binding)
             except:
                 pass  # Best effort cleanup
-
-        # Unbind all cell click handlers
-        if hasattr(self, 'calendar_cells'):
-            for cell_key, cell in self.calendar_cells.items():
-                if cell.get('click_handler'):
-                    try:
-                        cell['frame'].unbind('<Button-1>')
-                        cell['day_label'].unbind('<Button-1>')
-                        cell['entries_label'].unbind('<Button-1>')
-                        cell['click_handler'] = None
-                    except:
-                        pass  # Widget may have been destroyed
+            self.calendar_mousewheel_binding = None
 
     def refresh_calendar_view(self):
         """Refresh the calendar view with current log data"""
-        import calendar
-        from datetime import datetime
-
         if not self.current_log:
             return
 
@@ -1531,88 +1856,45 @@ class MedicationTrackerApp:
         except:
             return
 
-        # Update header
-        self.calendar_month_label.config(text=month_year)
-
-        # Get calendar for this month
-        cal = calendar.monthcalendar(year, month)
-
-        # Group entries by day
-        entries_by_day = {}
-        for entry in self.current_log.get('administration_log', []):
-            day = entry.get('day', 0)
-            if day not in entries_by_day:
-                entries_by_day[day] = []
-            entries_by_day[day].append(entry)
-
-        # Populate calendar cells
-        cell_idx = 0
-
-        for week_idx, week in enumerate(cal):
-            for day_idx, day in enumerate(week):
-                if cell_idx >= len(self.calendar_cells):
-                    break
-
-                cell = self.calendar_cells[(week_idx, day_idx)]
-                frame = cell['frame']
-                day_label = cell['day_label']
-                entries_label = cell['entries_label']
-
-                # Unbind old click handlers to prevent memory leak
-                if cell.get('click_handler'):
-                    frame.unbind('<Button-1>')
-                    day_label.unbind('<Button-1>')
-                    entries_label.unbind('<Button-1>')
-                    cell['click_handler'] = None
-
-                if day == 0:
-                    # Empty cell (day from prev/next month)
-                    day_label.config(text="")
-                    entries_label.config(text="")
-                    frame.config(bg='#f0f0f0')
-                    day_label.config(bg='#f0f0f0')
-                    entries_label.config(bg='#f0f0f0')
-                    cell['day_num'] = 0
-                else:
-                    # Valid day
-                    day_label.config(text=str(day))
-                    cell['day_num'] = day
-
-                    # Get entries for this day
-                    day_entries = entries_by_day.get(day, [])
-
-                    if day_entries:
-                        # Has entries - highlight
-                        frame.config(bg='#e8f4f8')
-                        day_label.config(bg='#e8f4f8')
-                        entries_label.config(bg='#e8f4f8')
-
-                        # Show detailed info (always)
-                        entry_text = '\n'.join([
-                            f"{e.get('time', '')} {e.get('initials', '')}"
-                            for e in day_entries[:3]  # Show max 3
-                        ])
-                        if len(day_entries) > 3:
-                            entry_text += f"\n+{len(day_entries)-3} more"
-                        entries_label.config(text=entry_text, font=self.SMALL_FONT)
-                    else:
-                        # No entries
-                        frame.config(bg='white')
-                        day_label.config(bg='white')
-                        entries_label.config(bg='white')
-                        entries_label.config(text="", font=self.SMALL_FONT)
-
-                    # Bind click to add entry for this day
-                    def make_click_handler(day_num):
-                        return lambda e: self.on_calendar_day_click(day_num)
+        dirty_days = self._dirty_calendar_days
+        whole_log = dirty_days is None
+        self._dirty_calendar_days = set()
+
+        # Entry rows grouped by day, kept current by refresh_entries_list
+        entries_by_day = self._entries_by_day
+
+        # Build the text shown in each day cell (only for changed days
+        # when the rest of the month is already drawn)
+        if whole_log:
+            self._calendar_day_text = {}
+            dirty_days = entries_by_day.keys()
+        day_text = self._calendar_day_text
+        for day in dirty_days:
+            day_entries = entries_by_day.get(day)
+            if not day_entries:
+                day_text.pop(day, None)
+                continue
+            day_text[day] = self._format_calendar_day(day_entries)
+
+        # Lay out the whole month only when it changes or the log was replaced
+        if whole_log or (year, month) != self._calendar_month:
+            self.calendar_month_label.config(text=month_year)
+            self._calendar_month = (year, month)
+            self._calendar_weeks = calendar.monthcalendar(year, month)
+            self._draw_calendar()
+        else:
+            self._redraw_calendar_days(dirty_days)
 
-                    handler = make_click_handler(day)
-                    frame.bind('<Button-1>', handler)
-                    day_label.bind('<Button-1>', handler)
-                    entries_label.bind('<Button-1>', handler)
+    def _format_calendar_day(self, day_entries):
+        """Text for a calendar cell: up to 3 'time initials' lines, then a count"""
+        if len(day_entries) == 1:
+            _, time, initials, _ = day_entries[0]
+            return f"{time} {initials}"
 
-                    # Store handler reference for cleanup
-                    cell['click_handler'] = handler
+        lines = [f"{time} {initials}" for _, time, initials, _ in day_entries[:3]]
+        if len(day_entries) > 3:
+            lines.append(f"+{len(day_entries) - 3} more")
+        return '\n'.join(lines)
 
     def on_calendar_day_click(self, day):
         """Handle click on calendar day - set day in entry form"""
@@ -1632,10 +1914,13 @@ class MedicationTrackerApp:
             return
         
         # Format JSON nicely
-        json_text = json.dumps(self.current_log, indent=2)
+        json_text = _json_dumps_pretty(self.current_log)
         
+        # Insert in chunks so Tk never copies the whole log in one string
         self.json_editor.delete('1.0', tk.END)
-        self.json_editor.insert('1.0', json_text)
+        chunk = self.JSON_INSERT_CHUNK
+        for start in range(0, len(json_text), chunk):
+            self.json_editor.insert(tk.END, json_text[start:start + chunk])
         
         self.editor_status.config(text="Loaded current log", foreground="green")
     
@@ -1648,7 +1933,7 @@ class MedicationTrackerApp:
         try:
             # Parse JSON
             json_text = self.json_editor.get('1.0', tk.END)
-            log_data = json.loads(json_text)
+            log_data = _json_loads(json_text)
 
             # Validate it has required fields
             if 'administration_log' not in log_data:
@@ -1657,6 +1942,8 @@ class MedicationTrackerApp:
             # Save
             self.log_manager.save_log(self.current_profile_id, self.current_medicine_name, self.current_month_year, log_data)
             self.current_log = log_data
+            self._entries_version += 1
+            self._dirty_calendar_days = None
             self.refresh_entries_list()
 
             self.editor_status.config(text="Changes saved successfully", foreground="green")
@@ -1669,95 +1956,16 @@ class MedicationTrackerApp:
             messagebox.showerror("Error", f"Failed to save: {e}")
             self.editor_status.config(text="Error saving changes", foreground="red")
 
-    def _export_log_to_excel(self, log_data, filename):
-        """Helper method to export log data to Excel file"""
-        try:
-            import openpyxl
-            from openpyxl.styles import Font, Alignment, PatternFill
-
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Medication Log"
-
-            # Add header
-            ws['A1'] = "Medication Log Data"
-            ws['A1'].font = Font(size=16, bold=True)
-
-            # Add basic info
-            row = 3
-            ws[f'A{row}'] = "Medicine Name:"
-            ws[f'B{row}'] = log_data.get('medicine_name', '')
-            row += 1
-
-            ws[f'A{row}'] = "Strength:"
-            ws[f'B{row}'] = log_data.get('strength', '')
-            row += 1
-
-            ws[f'A{row}'] = "Dosage:"
-            ws[f'B{row}'] = log_data.get('dosage', '')
-            row += 1
-
-            ws[f'A{row}'] = "Month/Year:"
-            ws[f'B{row}'] = log_data.get('month_year', '')
-            row += 1
-
-            ws[f'A{row}'] = "Reason Prescribed:"
-            ws[f'B{row}'] = log_data.get('reason_prescribed', '')
-            row += 1
-
-            ws[f'A{row}'] = "Reason PRN:"
-            ws[f'B{row}'] = log_data.get('reason_prn', '')
-            row += 2
-
-            # Add administration log table
-            ws[f'A{row}'] = "Administration Log"
-            ws[f'A{row}'].font = Font(size=14, bold=True)
-            row += 1
-
-            # Table headers
-            headers = ['Day', 'Time', 'Initials', 'Amount Remaining']
-            for col, header in enumerate(headers, start=1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-            row += 1
-
-            # Add administration entries
-            for entry in log_data.get('administration_log', []):
-                ws.cell(row=row, column=1, value=entry.get('day', ''))
-                ws.cell(row=row, column=2, value=entry.get('time', ''))
-                ws.cell(row=row, column=3, value=entry.get('initials', ''))
-                ws.cell(row=row, column=4, value=entry.get('amount_remaining', ''))
-                row += 1
-
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-            # Save workbook
-            wb.save(filename)
-
-        except ImportError:
-            raise ImportError("openpyxl library not installed. Install it with: pip install openpyxl")
-        except Exception as e:
-            raise Exception(f"Failed to export to Excel: {e}")
-
     def export_json_to_excel(self):
         """Export current JSON data to Excel from JSON editor"""
         if not self.current_log:
             messagebox.showwarning("Warning", "No log loaded to export")
             return
 
+        if self._exporting:
+            messagebox.showinfo("Export", "An export is already in progress")
+            return
+
         # Ask user for save location
         filename = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
@@ -1768,15 +1976,45 @@ class MedicationTrackerApp:
         if not filename:
             return
 
-        try:
-            self._export_log_to_excel(self.current_log, filename)
+        # Write the workbook on a worker thread from a snapshot of the log;
+        # the Tk thread polls a queue for the result
+        log_data = copy.deepcopy(self.current_log)
+        result_queue = queue.Queue()
+        self._exporting = True
+        self.editor_status.config(text="Exporting to Excel...", foreground="blue")
+
+        def worker():
+            error = None
+            try:
+                export_log_to_excel(log_data, filename)
+            except Exception as e:
+                error = e
+            finally:
+                result_queue.put(error)
+
+        def poll_result():
+            try:
+                error = result_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(100, poll_result)
+                return
+            self._on_excel_export_done(filename, error)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(100, poll_result)
+
+    def _on_excel_export_done(self, filename, error):
+        """Report the result of a background Excel export (runs on the Tk thread)"""
+        self._exporting = False
+
+        if error is None:
             messagebox.showinfo("Success", f"Exported to Excel:\n{filename}")
             self.editor_status.config(text=f"Exported to {os.path.basename(filename)}", foreground="green")
-        except ImportError as e:
-            messagebox.showerror("Error", str(e))
+        elif isinstance(error, ImportError):
+            messagebox.showerror("Error", str(error))
             self.editor_status.config(text="openpyxl not installed", foreground="red")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        else:
+            messagebox.showerror("Error", str(error))
             self.editor_status.config(text="Export failed", foreground="red")
     
     # Export methods
@@ -1786,9 +2024,6 @@ class MedicationTrackerApp:
             messagebox.showwarning("Warning", "No log loaded to export")
             return
 
-        # Get profile data
-        profile = self.profile_manager.get_profile(self.current_profile_id)
-
         # Create export options dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Export Options")
@@ -1861,11 +2096,24 @@ class MedicationTrackerApp:
         ).pack(pady=10, padx=20, anchor=tk.W)
 
         def proceed_with_export():
+            # Read the options once, before the dialog (and its variables) go away
+            want_word = export_word.get()
+            want_pdf = export_pdf.get()
+            want_excel = export_excel.get()
+            method = export_method.get()
+            with_images = include_images.get()
+            open_after = open_folder_after.get()
+
             # Validate at least one format is selected
-            if not export_word.get() and not export_pdf.get() and not export_excel.get():
+            if not want_word and not want_pdf and not want_excel:
                 messagebox.showwarning("No Format Selected", "Please select at least one export format.")
                 return
 
+            # A batch export may still be writing in the background
+            if self._exporting:
+                messagebox.showinfo("Export", "An export is already in progress")
+                return
+
             dialog.destroy()
 
             # Ask user if they want to use default patient folder or custom
@@ -1887,58 +2135,83 @@ class MedicationTrackerApp:
                 if not output_dir:
                     return
 
-            result = {}
-            msg = "Exported successfully:\n\n"
+            # Get profile data
+            profile = self.profile_manager.get_profile(self.current_profile_id)
 
-            try:
-                # Export Word/PDF if requested
-                if export_word.get() or export_pdf.get():
-                    word_pdf_result = self.export_manager.export_log(
-                        profile,
-                        self.current_log,
-                        output_dir=output_dir,
-                        create_pdf=export_pdf.get(),
-                        export_method=export_method.get(),
-                        include_images=include_images.get(),
-                        data_dir=os.path.join(self.data_dir, "patients")
-                    )
-                    result.update(word_pdf_result)
-
-                    if 'docx' in result:
-                        msg += f"{result['docx']}\n"
-                    if 'pdf' in result:
-                        msg += f"{result['pdf']}\n"
-
-                # Export to Excel if requested
-                if export_excel.get():
-                    # Determine Excel filename
-                    if 'docx' in result:
-                        excel_path = result['docx'].replace('.docx', '.xlsx')
-                    else:
-                        # Excel-only export, need to generate filename
-                        if output_dir is None:
-                            profile_id = profile.get('child_name', '').lower().replace(' ', '_')
-                            output_dir = self.export_manager.get_patient_export_dir(profile_id, os.path.join(self.data_dir, "patients"))
+            # Export on a worker thread from a snapshot of the log; the Tk
+            # thread polls a queue for the outcome
+            log_data = copy.deepcopy(self.current_log)
+            patients_dir = self.patients_dir
+            result_queue = queue.Queue()
 
-                        medicine_name = self.current_log.get('medicine_name', 'unknown').replace(' ', '_')
-                        month_year = self.current_log['month_year'].replace(' ', '_')
-                        filename_base = f"{medicine_name}_{month_year}"
-                        excel_path = os.path.join(output_dir, f"{filename_base}.xlsx")
+            def worker():
+                result = {}
+                excel_warning = None
+                error = None
+                try:
+                    # Export Word/PDF if requested
+                    if want_word or want_pdf:
+                        result.update(self.export_manager.export_log(
+                            profile,
+                            log_data,
+                            output_dir=output_dir,
+                            create_pdf=want_pdf,
+                            export_method=method,
+                            include_images=with_images,
+                            data_dir=patients_dir
+                        ))
 
-                    try:
-                        self._export_log_to_excel(self.current_log, excel_path)
-                        result['xlsx'] = excel_path
-                        msg += f"{excel_path}\n"
-                    except Exception as excel_error:
-                        if export_word.get() or export_pdf.get():
-                            messagebox.showwarning("Excel Export", f"Word/PDF exported successfully, but Excel export failed: {excel_error}")
+                    # Export to Excel if requested
+                    if want_excel:
+                        # Determine Excel filename
+                        if 'docx' in result:
+                            excel_path = os.path.splitext(result['docx'])[0] + '.xlsx'
                         else:
-                            raise
+                            # Excel-only export, need to generate filename
+                            excel_dir = output_dir
+                            if excel_dir is None:
+                                profile_id = profile.get('child_name', '').lower().replace(' ', '_')
+                                excel_dir = self.export_manager.get_patient_export_dir(profile_id, patients_dir)
+
+                            filename_base = self.export_manager.get_filename_base(log_data)
+                            excel_path = os.path.join(excel_dir, f"{filename_base}.xlsx")
+
+                        try:
+                            export_log_to_excel(log_data, excel_path)
+                            result['xlsx'] = excel_path
+                        except Exception as excel_error:
+                            if want_word or want_pdf:
+                                excel_warning = excel_error
+                            else:
+                                raise
+                except Exception as e:
+                    error = e
+                finally:
+                    result_queue.put((result, excel_warning, error))
+
+            def poll_result():
+                try:
+                    result, excel_warning, error = result_queue.get_nowait()
+                except queue.Empty:
+                    self.root.after(100, poll_result)
+                    return
+                self._exporting = False
+
+                if error is not None:
+                    messagebox.showerror("Export Error", f"Failed to export: {error}")
+                    return
+
+                if excel_warning is not None:
+                    messagebox.showwarning("Excel Export", f"Word/PDF exported successfully, but Excel export failed: {excel_warning}")
 
+                msg = "Exported successfully:\n\n"
+                for key in ('docx', 'pdf', 'xlsx'):
+                    if key in result:
+                        msg += f"{result[key]}\n"
                 messagebox.showinfo("Export Complete", msg.strip())
 
                 # Open folder if requested
-                if open_folder_after.get() and result:
+                if open_after and result:
                     # Get the directory from the first exported file
                     export_dir = None
                     for key in ['docx', 'pdf', 'xlsx']:
@@ -1948,19 +2221,14 @@ class MedicationTrackerApp:
 
                     if export_dir:
                         try:
-                            system = platform.system()
-                            if system == 'Windows':
-                                os.startfile(export_dir)
-                            elif system == 'Darwin':
-                                subprocess.run(['open', export_dir], check=True)
-                            else:
-                                subprocess.run(['xdg-open', export_dir], check=True)
+                            _open_path(export_dir)
                         except Exception as folder_error:
                             # Silently fail - folder opening is a convenience feature
                             pass
 
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {e}")
+            self._exporting = True
+            threading.Thread(target=worker, daemon=True).start()
+            self.root.after(100, poll_result)
 
         # Buttons
         btn_frame = ttk.Frame(dialog)
@@ -1969,13 +2237,28 @@ class MedicationTrackerApp:
         ttk.Button(btn_frame, text="Export", command=proceed_with_export, padding=5).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy, padding=5).pack(side=tk.LEFT, padx=5)
 
+    def _show_export_summary(self, title, text):
+        """Show a long export summary in a scrollable window"""
+        summary = tk.Toplevel(self.root)
+        summary.title(title)
+        summary.geometry("500x450")
+        summary.transient(self.root)
+
+        summary_text = scrolledtext.ScrolledText(summary, wrap=tk.WORD, font=self.NORMAL_FONT)
+        summary_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        summary_text.insert('1.0', text)
+        summary_text.config(state=tk.DISABLED)
+
+        ttk.Button(summary, text="OK", command=summary.destroy, width=12).pack(pady=(5, 10))
+        summary.grab_set()
+
     def open_export_dialog(self):
         """Open enhanced export dialog with patient and log selection"""
         # Create main export dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Export Medication Log")
-        dialog.geometry("500x650")
-        dialog.minsize(480, 600)
+        dialog.geometry("500x680")
+        dialog.minsize(480, 630)
 
         # Patient Selection Section
         ttk.Label(dialog, text="1. Select Patient:", font=self.HEADING_FONT).pack(pady=(10, 5))
@@ -1991,11 +2274,9 @@ class MedicationTrackerApp:
         patient_listbox.config(yscrollcommand=patient_scrollbar.set)
 
         # Load patients
-        profiles = self.profile_manager.get_profile_list()
-        patient_map = {}  # Maps listbox index to profile_id
-        for idx, (profile_id, profile_name) in enumerate(profiles):
-            patient_listbox.insert(tk.END, profile_name)
-            patient_map[idx] = profile_id
+        profiles = self._profile_list
+        patient_map = {idx: profile_id for idx, (profile_id, _) in enumerate(profiles)}  # Maps listbox index to profile_id
+        patient_listbox.insert(tk.END, *[profile_name for _, profile_name in profiles])
 
         # Medication Log Selection Section
         ttk.Label(dialog, text="2. Select Medication Log(s):", font=self.HEADING_FONT).pack(pady=(15, 5))
@@ -2013,6 +2294,7 @@ class MedicationTrackerApp:
         log_listbox.config(yscrollcommand=log_scrollbar.set)
 
         log_map = {}  # Maps listbox index to (medicine_name, month_year)
+        logs_by_month = defaultdict(list)  # Maps month_year to listbox indices
 
         # Selection helper buttons
         selection_btn_frame = ttk.Frame(dialog)
@@ -2045,9 +2327,7 @@ class MedicationTrackerApp:
             select_frame.pack(pady=10)
 
             ttk.Label(select_frame, text="Month:").grid(row=0, column=0, padx=5, pady=5)
-            months = ['January', 'February', 'March', 'April', 'May', 'June',
-                     'July', 'August', 'September', 'October', 'November', 'December']
-            month_combo = ttk.Combobox(select_frame, values=months, state='readonly', width=12)
+            month_combo = ttk.Combobox(select_frame, values=self.MONTHS, state='readonly', width=12)
             month_combo.grid(row=0, column=1, padx=5, pady=5)
             month_combo.current(0)
 
@@ -2071,11 +2351,10 @@ class MedicationTrackerApp:
                 log_listbox.selection_clear(0, tk.END)
 
                 # Select matching logs
-                matches = 0
-                for idx, (med_name, month_year) in log_map.items():
-                    if month_year == target_month_year:
-                        log_listbox.selection_set(idx)
-                        matches += 1
+                indices = logs_by_month.get(target_month_year, ())
+                for idx in indices:
+                    log_listbox.selection_set(idx)
+                matches = len(indices)
 
                 month_dialog.destroy()
 
@@ -2097,6 +2376,7 @@ class MedicationTrackerApp:
             """Update log list when patient is selected"""
             log_listbox.delete(0, tk.END)
             log_map.clear()
+            logs_by_month.clear()
 
             selection = patient_listbox.curselection()
             if not selection:
@@ -2105,10 +2385,10 @@ class MedicationTrackerApp:
             profile_id = patient_map[selection[0]]
             logs = self.log_manager.list_logs_for_profile(profile_id)
 
-            for idx, (medicine_name, month_year) in enumerate(logs):
-                display_text = f"{medicine_name} - {month_year}"
-                log_listbox.insert(tk.END, display_text)
-                log_map[idx] = (medicine_name, month_year)
+            log_map.update(enumerate(logs))
+            for idx, (_, month_year) in enumerate(logs):
+                logs_by_month[month_year].append(idx)
+            log_listbox.insert(tk.END, *[f"{medicine_name} - {month_year}" for medicine_name, month_year in logs])
 
         patient_listbox.bind('<<ListboxSelect>>', on_patient_select)
 
@@ -2167,6 +2447,13 @@ class MedicationTrackerApp:
             variable=export_excel
         ).pack(side=tk.LEFT, padx=5)
 
+        combine_excel = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            options_frame,
+            text="Combine Excel exports into one workbook (a sheet per log)",
+            variable=combine_excel
+        ).pack(anchor=tk.W, padx=20, pady=2)
+
         # Open folder after export checkbox
         open_folder_after = tk.BooleanVar(value=True)
         ttk.Checkbutton(
@@ -2194,8 +2481,11 @@ class MedicationTrackerApp:
                 messagebox.showwarning("No Format Selected", "Please select at least one export format.")
                 return
 
+            if self._exporting:
+                messagebox.showinfo("Export", "An export is already in progress")
+                return
+
             profile_id = patient_map[patient_sel[0]]
-            profile = self.profile_manager.get_profile(profile_id)
 
             dialog.destroy()
 
@@ -2218,128 +2508,238 @@ class MedicationTrackerApp:
                 if not output_dir:
                     return
 
-            # Export each selected log
-            all_results = []
-            errors = []
-            total_files = 0
+            profile = self.profile_manager.get_profile(profile_id)
+
+            # Snapshot the options and load the selected logs now; the export
+            # itself runs on a worker thread and reports back through a queue
+            # polled by the Tk loop
+            want_word = export_word.get()
+            want_pdf = export_pdf.get()
+            want_excel = export_excel.get()
+            want_combined = want_excel and combine_excel.get()
+            method = export_method.get()
+            with_images = include_images.get()
+            open_after = open_folder_after.get()
+            patients_dir = self.patients_dir
+            template_path = self.export_manager.template_path
+
+            # Files go to the patient folder when no folder was chosen
+            if output_dir is None:
+                profile_id_str = profile.get('child_name', '').lower().replace(' ', '_')
+                output_dir = self.export_manager.get_patient_export_dir(profile_id_str, patients_dir)
+
+            # Stop before writing anything if the batch clearly won't fit
+            try:
+                free_space = shutil.disk_usage(output_dir).free
+            except OSError:
+                free_space = None  # Can't tell - let the export report any failure
+            needed_space = len(log_sel) * self.EXPORT_BYTES_PER_LOG * 2
+            if free_space is not None and free_space < needed_space:
+                messagebox.showerror(
+                    "Not Enough Disk Space",
+                    f"The export folder has {free_space // (1024 * 1024)} MB free, but exporting "
+                    f"{len(log_sel)} log(s) needs about {needed_space // (1024 * 1024)} MB.\n\n"
+                    "Free up some space or choose another folder."
+                )
+                return
 
+            jobs = []
+            load_errors = []
             for log_idx in log_sel:
                 medicine_name, month_year = log_map[log_idx]
                 log_data = self.log_manager.get_log(profile_id, medicine_name, month_year)
+                if log_data:
+                    jobs.append((f"{medicine_name} - {month_year}", log_data))
+                else:
+                    load_errors.append(f"Failed to load: {medicine_name} - {month_year}")
+
+            progress_queue = queue.Queue()
+
+            def run_export():
+                """Export the logs; returns (results, errors, file count)"""
+                want_docx = want_word or want_pdf
+                want_log_excel = want_excel and not want_combined
+                results = [({}, None) for _ in jobs]
+
+                # Large batches write Word and per-log Excel files in parallel
+                # worker processes; PDF conversion drives Word itself, so it
+                # runs here one file at a time as each log finishes
+                if want_docx or want_log_excel:
+                    def export_args(log_data):
+                        return (template_path, profile, log_data, output_dir, want_docx,
+                                want_log_excel, method, with_images, patients_dir)
+
+                    def finish(done, job_idx, result, error):
+                        if result is not None and want_pdf and 'docx' in result:
+                            pdf_path = self.export_manager.export_to_pdf(result['docx'])
+                            if pdf_path:
+                                result['pdf'] = pdf_path
+
+                        results[job_idx] = (result, error)
+                        progress_queue.put(('progress', done, jobs[job_idx][0]))
+
+                    max_workers = min(len(jobs), max(1, (os.cpu_count() or 1) - 1),
+                                      self.EXPORT_MAX_WORKERS)
+                    if len(jobs) >= self.EXPORT_PROCESS_POOL_MIN_LOGS and max_workers > 1:
+                        # Workers are always spawned: forking this process would
+                        # copy the Tk interpreter and the threads running in it
+                        with ProcessPoolExecutor(max_workers=max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+                            futures = {
+                                executor.submit(run_single_export, *export_args(log_data)): job_idx
+                                for job_idx, (_, log_data) in enumerate(jobs)
+                            }
+
+                            for done, future in enumerate(as_completed(futures), 1):
+                                try:
+                                    result, error = future.result()
+                                except Exception as e:
+                                    result, error = None, str(e)
+                                finish(done, futures[future], result, error)
+                    else:
+                        for job_idx, (_, log_data) in enumerate(jobs):
+                            finish(job_idx + 1, job_idx, *run_single_export(*export_args(log_data)))
+
+                errors = list(load_errors)
+                total_files = 0
+
+                # All logs go into one workbook, a sheet each, written once
+                sheet_titles = [None] * len(jobs)
+                combined_name = None
+                if want_combined and jobs:
+                    sheet_titles = excel_sheet_titles(log_label for log_label, _ in jobs)
+                    combined_path = os.path.join(output_dir, f"{profile_id}_medication_logs.xlsx")
+                    # Excel-only batches have no other progress to show
+                    on_sheet = None
+                    if not want_docx:
+                        def on_sheet(done, title):
+                            progress_queue.put(('progress', done, title))
+
+                    try:
+                        export_logs_to_excel(
+                            [(title, log_data) for title, (_, log_data) in zip(sheet_titles, jobs)],
+                            combined_path,
+                            on_sheet=on_sheet
+                        )
+                        combined_name = os.path.basename(combined_path)
+                        total_files += 1
+                    except Exception as excel_error:
+                        errors.append(f"Combined Excel workbook: {excel_error}")
+
+                # Collect in selection order
+                all_results = []
+                for (log_label, _), sheet_title, (result, error) in zip(jobs, sheet_titles, results):
+                    # A log whose own export failed isn't listed, even if its
+                    # sheet made it into the combined workbook
+                    if result is None:
+                        if combined_name is not None:
+                            error = f"{error} (its sheet '{sheet_title}' is in {combined_name})"
+                        errors.append(f"{log_label}: {error}")
+                        continue
+                    if error:
+                        errors.append(f"{log_label}: {error}")
+
+                    log_files = [os.path.basename(result[key]) for key in ('docx', 'pdf', 'xlsx') if key in result]
+                    total_files += len(log_files)
+                    if combined_name is not None:
+                        log_files.append(f"{combined_name} (sheet '{sheet_title}')")
+                    all_results.append({
+                        'log': log_label,
+                        'files': log_files
+                    })
 
-                if not log_data:
-                    errors.append(f"Failed to load: {medicine_name} - {month_year}")
-                    continue
+                return all_results, errors, total_files
 
+            def worker():
+                """Run the export off the Tk thread, always reporting back when it ends"""
+                outcome = ('error', len(jobs), "The export stopped unexpectedly")
                 try:
-                    result = {}
-                    log_files = []
+                    outcome = ('done', len(jobs), run_export())
+                except Exception as e:
+                    outcome = ('error', len(jobs), str(e))
+                finally:
+                    progress_queue.put(outcome)
 
-                    # Export Word/PDF if requested
-                    if export_word.get() or export_pdf.get():
-                        word_pdf_result = self.export_manager.export_log(
-                            profile,
-                            log_data,
-                            output_dir=output_dir,
-                            create_pdf=export_pdf.get(),
-                            export_method=export_method.get(),
-                            include_images=include_images.get(),
-                            data_dir=os.path.join(self.data_dir, "patients")
-                        )
-                        result.update(word_pdf_result)
+            # Progress dialog (modal, can't be closed while exporting)
+            progress_dialog = tk.Toplevel(self.root)
+            progress_dialog.title("Exporting")
+            progress_dialog.geometry("380x120")
+            progress_dialog.resizable(False, False)
+            progress_dialog.transient(self.root)
+            progress_dialog.protocol("WM_DELETE_WINDOW", lambda: None)
 
-                        if 'docx' in result:
-                            log_files.append(os.path.basename(result['docx']))
-                            total_files += 1
-                        if 'pdf' in result:
-                            log_files.append(os.path.basename(result['pdf']))
-                            total_files += 1
+            progress_label = ttk.Label(progress_dialog, text="Preparing export...", font=self.NORMAL_FONT)
+            progress_label.pack(pady=(15, 5), padx=20, anchor=tk.W)
 
-                    # Export to Excel if requested
-                    if export_excel.get():
-                        # Determine Excel filename
-                        if 'docx' in result:
-                            excel_path = result['docx'].replace('.docx', '.xlsx')
-                        else:
-                            # Excel-only export, need to generate filename
-                            if output_dir is None:
-                                profile_id_str = profile.get('child_name', '').lower().replace(' ', '_')
-                                output_dir = self.export_manager.get_patient_export_dir(profile_id_str, os.path.join(self.data_dir, "patients"))
+            progress_bar = ttk.Progressbar(progress_dialog, maximum=len(jobs), length=340, mode='determinate')
+            progress_bar.pack(pady=5, padx=20)
 
-                            medicine_name_clean = log_data.get('medicine_name', 'unknown').replace(' ', '_')
-                            month_year_clean = log_data['month_year'].replace(' ', '_')
-                            filename_base = f"{medicine_name_clean}_{month_year_clean}"
-                            excel_path = os.path.join(output_dir, f"{filename_base}.xlsx")
+            progress_count = ttk.Label(progress_dialog, text=f"0/{len(jobs)}", font=self.NORMAL_FONT)
+            progress_count.pack(pady=5)
 
-                        try:
-                            self._export_log_to_excel(log_data, excel_path)
-                            result['xlsx'] = excel_path
-                            log_files.append(os.path.basename(excel_path))
-                            total_files += 1
-                        except Exception as excel_error:
-                            if export_word.get() or export_pdf.get():
-                                errors.append(f"{medicine_name} - {month_year}: Excel export failed ({excel_error})")
-                            else:
-                                raise
+            progress_dialog.grab_set()
 
-                    all_results.append({
-                        'log': f"{medicine_name} - {month_year}",
-                        'files': log_files
-                    })
+            def poll_progress():
+                """Apply worker updates; finish up once the worker is done"""
+                while True:
+                    try:
+                        kind, done, payload = progress_queue.get_nowait()
+                    except queue.Empty:
+                        break
 
-                except Exception as e:
-                    errors.append(f"{medicine_name} - {month_year}: {str(e)}")
+                    progress_bar['value'] = done
+                    progress_count.config(text=f"{done}/{len(jobs)}")
 
-            # Show results
-            msg = f"Export Complete!\n\nExported {len(all_results)} log(s) to {total_files} file(s)\n\n"
+                    if kind in ('done', 'error'):
+                        self._exporting = False
+                        progress_dialog.grab_release()
+                        progress_dialog.destroy()
+                        if kind == 'done':
+                            show_results(*payload)
+                        else:
+                            messagebox.showerror("Export Error", f"Failed to export: {payload}")
+                        return
 
-            for item in all_results:
-                msg += f"{item['log']}:\n"
-                for file in item['files']:
-                    msg += f"  • {file}\n"
-                msg += "\n"
+                    progress_label.config(text=f"Exported {payload}")
 
-            if errors:
-                msg += "\nErrors:\n"
-                for error in errors:
-                    msg += f"  ⚠ {error}\n"
+                self.root.after(100, poll_progress)
 
-            if errors:
-                messagebox.showwarning("Export Complete with Errors", msg.strip())
-            else:
-                messagebox.showinfo("Export Complete", msg.strip())
+            def show_results(all_results, errors, total_files):
+                """Report the finished export (runs on the Tk thread)"""
+                parts = ["Export Complete!", "", f"Exported {len(all_results)} log(s) to {total_files} file(s)", ""]
 
-            # Open folder if requested and files were exported
-            if open_folder_after.get() and all_results:
-                # Get the export directory from the first result
-                # We need to trace back to find where the files were saved
-                # The output_dir variable should be accessible here
-                folder_to_open = output_dir
-
-                # If output_dir is None, files went to patient folder
-                if folder_to_open is None and all_results:
-                    # Try to get directory from the first exported file
-                    # We need to look at the actual result data
-                    try:
-                        # Get profile to find patient folder
-                        profile_id_str = profile.get('child_name', '').lower().replace(' ', '_')
-                        folder_to_open = self.export_manager.get_patient_export_dir(profile_id_str, os.path.join(self.data_dir, "patients"))
-                    except:
-                        folder_to_open = None
+                for item in all_results:
+                    parts.append(f"{item['log']}:")
+                    parts.extend(f"  • {file}" for file in item['files'])
+                    parts.append("")
+
+                if errors:
+                    parts.extend(("", "Errors:"))
+                    parts.extend(f"  ⚠ {error}" for error in errors)
+
+                msg = "\n".join(parts).strip()
+                title = "Export Complete with Errors" if errors else "Export Complete"
 
-                if folder_to_open:
+                if len(all_results) > self.EXPORT_SUMMARY_MAX_LOGS:
+                    # Too long for a message box - show it in a scrollable window
+                    self._show_export_summary(title, msg)
+                elif errors:
+                    messagebox.showwarning(title, msg)
+                else:
+                    messagebox.showinfo(title, msg)
+
+                # Open folder if requested and files were exported
+                if open_after and all_results:
                     try:
-                        system = platform.system()
-                        if system == 'Windows':
-                            os.startfile(folder_to_open)
-                        elif system == 'Darwin':
-                            subprocess.run(['open', folder_to_open], check=True)
-                        else:
-                            subprocess.run(['xdg-open', folder_to_open], check=True)
+                        _open_path(output_dir)
                     except Exception as folder_error:
                         # Silently fail - folder opening is a convenience feature
                         pass
 
+            self._exporting = True
+            threading.Thread(target=worker, daemon=True).start()
+            self.root.after(100, poll_progress)
+
         # Buttons
         btn_frame = ttk.Frame(dialog)
         btn_frame.pack(pady=20, padx=10)
@@ -2409,6 +2809,16 @@ class MedicationTrackerApp:
         else:  # Cancel
             return False
 
+    def _bind_text_modified(self, text_widget, mark_dirty):
+        """Call mark_dirty when a Text widget's contents are edited"""
+        def on_modified(event):
+            # Resetting the flag fires <<Modified>> again; ignore that one
+            if text_widget.edit_modified():
+                text_widget.edit_modified(False)
+                mark_dirty()
+
+        text_widget.bind('<<Modified>>', on_modified)
+
     def mark_profile_dirty(self, *args):
         """Mark profile as having unsaved changes"""
         self.profile_dirty = True
@@ -2431,7 +2841,7 @@ class MedicationTrackerApp:
 
     def open_data_folder(self):
         """Open the data folder in the system's file explorer"""
-        data_dir = self.profile_manager.data_dir
+        data_dir = self.data_dir
 
         try:
             # Check if directory exists
@@ -2441,18 +2851,8 @@ class MedicationTrackerApp:
                                       "It will be created when you save your first profile.")
                 return
 
-            # Open folder based on operating system
-            system = platform.system()
-
-            if system == 'Windows':
-                # Windows: use explorer
-                os.startfile(data_dir)
-            elif system == 'Darwin':
-                # macOS: use open command
-                subprocess.run(['open', data_dir], check=True)
-            else:
-                # Linux: try xdg-open
-                subprocess.run(['xdg-open', data_dir], check=True)
+            # Open folder with the platform's file explorer
+            _open_path(data_dir)
 
         except Exception as e:
             messagebox.showerror("Error Opening Folder",
@@ -5,9 +5,8 @@ Main entry point for the application
 """
 
 import sys
-import tkinter as tk
-from tkinter import messagebox
 import logging
+import multiprocessing
 
 # Import configuration
 from config import APP_NAME, get_version_string
@@ -15,10 +14,7 @@ from config import APP_NAME, get_version_string
 # Import core modules
 from core.resource_manager import ResourceManager
 from core.data_migration import DataMigrator
-from core.logging_config import setup_logging, clean_old_logs, log_exception
-
-# Import GUI
-from gui.tkinter_app import MedicationTrackerApp
+from core.logging_config import setup_logging, clean_old_logs, log_exception, stop_logging
 
 
 def initialize_application():
@@ -63,16 +59,28 @@ def initialize_application():
 
 def main():
     """Launch the application"""
+    # The GUI is imported here rather than at module level: export worker
+    # processes are spawned, re-run this file as __mp_main__, and must not
+    # load tkinter, PIL or the GUI module
+    import tkinter as tk
+    from tkinter import messagebox
+    from gui.tkinter_app import MedicationTrackerApp
+
     logger = logging.getLogger(__name__)
 
+    # A single Tk root serves both the error dialogs and the application
+    # window; it stays hidden until the GUI has been built
+    root = None
+
     try:
+        root = tk.Tk()
+        root.withdraw()
+
         # Initialize application
         success, error_message = initialize_application()
 
         if not success:
             # Show error to user before GUI starts
-            root = tk.Tk()
-            root.withdraw()  # Hide main window
             messagebox.showerror(
                 "Initialization Error",
                 f"Failed to initialize {APP_NAME}:\n\n{error_message}\n\n"
@@ -83,14 +91,15 @@ def main():
 
         # Launch GUI
         logger.info("Launching GUI...")
-        root = tk.Tk()
         app = MedicationTrackerApp(root)
+        root.deiconify()
         logger.info("GUI initialized successfully")
 
         # Run main loop
         root.mainloop()
 
         logger.info("Application closed normally")
+        stop_logging()
 
     except Exception as e:
         # Log unexpected errors
@@ -100,9 +109,15 @@ def main():
         else:
             logging.error(error_msg, exc_info=True)
 
-        # Show error to user
+        # Show error to user, reusing the root if it is still alive
         try:
-            root = tk.Tk()
+            try:
+                root_alive = root is not None and root.winfo_exists()
+            except tk.TclError:
+                root_alive = False  # Already destroyed
+
+            if not root_alive:
+                root = tk.Tk()
             root.withdraw()
             messagebox.showerror(
                 "Application Error",
@@ -117,4 +132,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Export worker processes need this in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     main()